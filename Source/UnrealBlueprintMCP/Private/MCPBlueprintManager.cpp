@@ -37,6 +37,23 @@
 
 DEFINE_LOG_CATEGORY_STATIC(LogMCPBlueprintManager, Log, All);
 
+// Vectors may arrive as [x, y, z] numbers; convert them to the text form the property setter parses
+static FString JsonValueToPropertyString(const TSharedPtr<FJsonValue>& Value)
+{
+	if (!Value.IsValid())
+	{
+		return FString();
+	}
+
+	const TArray<TSharedPtr<FJsonValue>>* VectorValues = nullptr;
+	if (Value->TryGetArray(VectorValues) && VectorValues->Num() == 3)
+	{
+		return FVector((*VectorValues)[0]->AsNumber(), (*VectorValues)[1]->AsNumber(), (*VectorValues)[2]->AsNumber()).ToString();
+	}
+
+	return Value->AsString();
+}
+
 // Static member definitions
 UMCPBlueprintManager* UMCPBlueprintManager::SingletonInstance = nullptr;
 const FString UMCPBlueprintManager::DefaultAssetPath = TEXT("/Game/Blueprints/");
@@ -272,6 +289,52 @@ FString UMCPBlueprintManager::ProcessSetPropertyCommand(const FString& JsonComma
 	return CreateJsonResponse(Result);
 }
 
+FString UMCPBlueprintManager::ProcessCreateBlueprintWithPropertiesCommand(const FString& JsonCommand)
+{
+	FMCPBlueprintCreateParams CreateParams;
+	TSharedPtr<FJsonObject> JsonObject;
+	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(JsonCommand);
+
+	// Parse JSON command once; the same object holds the properties map
+	if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !ParseCreateBlueprintJson(JsonObject, CreateParams))
+	{
+		FMCPBlueprintOperationResult ErrorResult(false, TEXT("Failed to parse JSON command"));
+		return CreateJsonResponse(ErrorResult);
+	}
+
+	// Execute blueprint creation
+	FMCPBlueprintOperationResult Result = CreateBlueprint(CreateParams);
+
+	// Set the requested properties on the new blueprint, stopping at the first failure
+	const TSharedPtr<FJsonObject>* Properties = nullptr;
+	if (Result.bSuccess && JsonObject->HasField(TEXT("properties")) && !JsonObject->TryGetObjectField(TEXT("properties"), Properties))
+	{
+		FString ErrorMessage = TEXT("'properties' must be a JSON object");
+		LogMessage(ErrorMessage, ELogVerbosity::Error);
+		Result = FMCPBlueprintOperationResult(false, ErrorMessage, Result.BlueprintPath);
+	}
+	else if (Result.bSuccess && Properties)
+	{
+		for (const TPair<FString, TSharedPtr<FJsonValue>>& Property : (*Properties)->Values)
+		{
+			FMCPBlueprintPropertyParams PropertyParams;
+			PropertyParams.BlueprintPath = Result.BlueprintPath;
+			PropertyParams.PropertyName = Property.Key;
+			PropertyParams.PropertyValue = JsonValueToPropertyString(Property.Value);
+
+			FMCPBlueprintOperationResult PropertyResult = SetBlueprintProperty(PropertyParams);
+			if (!PropertyResult.bSuccess)
+			{
+				Result = PropertyResult;
+				break;
+			}
+		}
+	}
+
+	// Return JSON response
+	return CreateJsonResponse(Result);
+}
+
 TArray<FString> UMCPBlueprintManager::GetAvailableParentClasses() const
 {
 	return SupportedParentClasses;
@@ -527,7 +590,17 @@ bool UMCPBlueprintManager::ParseCreateBlueprintJson(const FString& JsonCommand,
 	TSharedPtr<FJsonObject> JsonObject;
 	TSharedRef<TJsonReader<>> Reader = TJsonReaderFactory<>::Create(JsonCommand);
 
-	if (!FJsonSerializer::Deserialize(Reader, JsonObject) || !JsonObject.IsValid())
+	if (!FJsonSerializer::Deserialize(Reader, JsonObject))
+	{
+		return false;
+	}
+
+	return ParseCreateBlueprintJson(JsonObject, OutParams);
+}
+
+bool UMCPBlueprintManager::ParseCreateBlueprintJson(const TSharedPtr<FJsonObject>& JsonObject, FMCPBlueprintCreateParams& OutParams) const
+{
+	if (!JsonObject.IsValid())
 	{
 		return false;
 	}
@@ -558,7 +631,7 @@ bool UMCPBlueprintManager::ParseSetPropertyJson(const FString& JsonCommand, FMCP
 	// Parse parameters
 	OutParams.BlueprintPath = JsonObject->GetStringField(TEXT("blueprint_path"));
 	OutParams.PropertyName = JsonObject->GetStringField(TEXT("property_name"));
-	OutParams.PropertyValue = JsonObject->GetStringField(TEXT("property_value"));
+	OutParams.PropertyValue = JsonValueToPropertyString(JsonObject->TryGetField(TEXT("property_value")));
 	OutParams.PropertyType = JsonObject->GetStringField(TEXT("property_type"));
 
 	return true;
@@ -856,6 +929,7 @@ FString UMCPBlueprintManager::GetServerStatus() const
 	TArray<TSharedPtr<FJsonValue>> SupportedOperations;
 	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("create_blueprint"))));
 	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("set_property"))));
+	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("create_blueprint_with_properties"))));
 	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("add_component"))));
 	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("compile_blueprint"))));
 	SupportedOperations.Add(MakeShareable(new FJsonValueString(TEXT("get_server_status"))));
@@ -605,6 +605,7 @@ void UMCPClient::ProcessIncomingMessage(const FString& JsonMessage)
 		if (Message.Type == TEXT("request") && !Message.Method.IsEmpty())
 		{
 			if (Message.Method == TEXT("create_blueprint") ||
+				Message.Method == TEXT("create_blueprint_with_properties") ||
 				Message.Method == TEXT("set_property") ||
 				Message.Method == TEXT("set_blueprint_property") ||
 				Message.Method == TEXT("add_component") ||
@@ -958,6 +959,10 @@ FString UMCPClient::ProcessBlueprintCommand(const FString& Method, const FString
 	{
 		return BlueprintManager->ProcessCreateBlueprintCommand(Params);
 	}
+	else if (Method == TEXT("create_blueprint_with_properties"))
+	{
+		return BlueprintManager->ProcessCreateBlueprintWithPropertiesCommand(Params);
+	}
 	else if (Method == TEXT("set_property") || Method == TEXT("set_blueprint_property"))
 	{
 		return BlueprintManager->ProcessSetPropertyCommand(Params);
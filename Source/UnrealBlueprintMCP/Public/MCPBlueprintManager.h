@@ -185,6 +185,15 @@ public:
 	UFUNCTION(BlueprintCallable, Category = "MCP Blueprint Manager")
 	FString ProcessSetPropertyCommand(const FString& JsonCommand);
 
+	/**
+	 * Process a create_blueprint_with_properties JSON command from MCP
+	 * Creates the blueprint, then sets each entry of its "properties" object
+	 * @param JsonCommand The JSON command object
+	 * @return JSON response as string
+	 */
+	UFUNCTION(BlueprintCallable, Category = "MCP Blueprint Manager")
+	FString ProcessCreateBlueprintWithPropertiesCommand(const FString& JsonCommand);
+
 	/**
 	 * Process an add_component JSON command from MCP
 	 * @param JsonCommand The JSON command object
@@ -327,6 +336,14 @@ private:
 	 */
 	bool ParseCreateBlueprintJson(const FString& JsonCommand, FMCPBlueprintCreateParams& OutParams) const;
 
+	/**
+	 * Read create params from an already parsed JSON command
+	 * @param JsonObject Parsed JSON command
+	 * @param OutParams Output parameters
+	 * @return True if parsing was successful
+	 */
+	bool ParseCreateBlueprintJson(const TSharedPtr<FJsonObject>& JsonObject, FMCPBlueprintCreateParams& OutParams) const;
+
 	/**
 	 * Parse JSON command into property params
 	 * @param JsonCommand JSON command string
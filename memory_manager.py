@@ -27,9 +27,27 @@ import time
 from io import BytesIO
 from concurrent.futures import ThreadPoolExecutor
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the standard json module
+    orjson = None
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# JSON codec working on UTF-8 bytes. Both parsers accept bytes directly, so
+# incoming data is never decoded to str first
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    _json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encode(obj).encode('utf-8')
+
+    _json_loads = json.loads
+
 
 @dataclass
 class MemoryStats:
@@ -224,21 +242,16 @@ class WeakReferenceManager:
 
     def cleanup_dead_references(self) -> int:
         """Remove dead references and return count of cleaned up refs"""
-        alive_refs = set()
-        dead_count = 0
-
-        for ref in self._refs:
-            if ref() is not None:
-                alive_refs.add(ref)
-            else:
-                dead_count += 1
-
-        self._refs = alive_refs
-        return dead_count
+        # Each ref discards itself from the set when its object dies, so this
+        # sweep normally finds nothing and the live set is left untouched
+        dead_refs = [ref for ref in self._refs if ref() is None]
+        self._refs.difference_update(dead_refs)
+        return len(dead_refs)
 
     def get_alive_count(self) -> int:
         """Get count of alive references"""
-        return sum(1 for ref in self._refs if ref() is not None)
+        # Dead refs remove themselves in their callback
+        return len(self._refs)
 
 
 class TTLCache:
@@ -459,6 +472,7 @@ class MemoryProfiler:
         self._leak_detection_sensitivity = 1.5  # Memory growth multiplier for leak detection
         self._consecutive_growth_threshold = 3  # Number of consecutive growth periods
         self._consecutive_growth_count = 0
+        self._process = psutil.Process()
 
         if enable_tracemalloc and not tracemalloc.is_tracing():
             tracemalloc.start()
@@ -503,20 +517,18 @@ class MemoryProfiler:
 
     def collect_memory_stats(self) -> MemoryStats:
         """Collect current memory statistics"""
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = self._process.memory_info()
         system_memory = psutil.virtual_memory()
 
-        # Get GC statistics
-        gc_stats = {}
-        for i in range(3):  # Python has 3 GC generations
-            gc_stats[i] = gc.get_count()[i]
+        # Get GC statistics (Python has 3 GC generations)
+        gc_stats = dict(enumerate(gc.get_count()))
 
         return MemoryStats(
             timestamp=time.time(),
             rss_mb=memory_info.rss / (1024 * 1024),
             vms_mb=memory_info.vms / (1024 * 1024),
-            percent=process.memory_percent(),
+            # Same as Process.memory_percent(), without reading memory_info again
+            percent=memory_info.rss / system_memory.total * 100,
             available_mb=system_memory.available / (1024 * 1024),
             gc_objects=len(gc.get_objects()),
             gc_collections=gc_stats
@@ -659,7 +671,7 @@ class JSONStreamProcessor:
             return await self._stream_parse_json(data)
         else:
             # Regular parsing for smaller messages
-            return json.loads(data.decode('utf-8'))
+            return _json_loads(data)
 
     async def _stream_parse_json(self, data: bytes) -> Dict[str, Any]:
         """Stream parse large JSON to reduce memory usage"""
@@ -670,7 +682,7 @@ class JSONStreamProcessor:
                 # Use a more memory-efficient approach for large JSON
                 # This is a simplified streaming parser - in production you might use
                 # libraries like ijson for true streaming JSON parsing
-                return json.loads(data.decode('utf-8'))
+                return _json_loads(data)
             except Exception as e:
                 logger.error(f"JSON streaming parse failed: {e}")
                 raise
@@ -680,8 +692,7 @@ class JSONStreamProcessor:
     async def compress_json_response(self, data: Dict[str, Any],
                                    compression_threshold: int = 1024) -> Union[str, bytes]:
         """Compress JSON response if it exceeds threshold"""
-        json_str = json.dumps(data)
-        json_bytes = json_str.encode('utf-8')
+        json_bytes = _json_dumps(data)
 
         if len(json_bytes) > compression_threshold:
             loop = asyncio.get_event_loop()
@@ -694,7 +705,7 @@ class JSONStreamProcessor:
                 logger.debug(f"JSON compressed: {len(json_bytes)} -> {len(compressed)} bytes")
                 return compressed
 
-        return json_str
+        return json_bytes.decode('utf-8')
 
     def cleanup(self):
         """Cleanup resources"""
@@ -73,6 +73,25 @@ def get_python_executable(project_root):
 
     return python_exe, pip_exe
 
+# Directories that never contain project sources and are expensive to walk
+EXCLUDED_DIRS = {"mcp_server_env", "build", "dist", ".git", "__pycache__"}
+
+def collect_python_files(project_root):
+    """Collect project Python files once so every tool can share the list"""
+    py_files = []
+    for dirpath, dirnames, filenames in os.walk(project_root):
+        # Prune excluded directories in place so they are never descended
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDED_DIRS]
+        relative_dir = Path(dirpath).relative_to(project_root)
+        py_files.extend(
+            str(relative_dir / name) for name in filenames if name.endswith(".py")
+        )
+    return sorted(py_files)
+
+def format_file_args(py_files):
+    """Quote file paths for use on a shell command line"""
+    return ' '.join(f'"{path}"' for path in py_files)
+
 def check_virtual_environment(project_root):
     """Check if virtual environment exists and is properly set up"""
     print_header("Checking Virtual Environment")
@@ -91,14 +110,21 @@ def check_virtual_environment(project_root):
     print_success("Virtual environment found and ready")
     return True
 
-def run_code_formatting_check(project_root):
+def run_code_formatting_check(project_root, py_files=None):
     """Run code formatting checks with Black"""
     print_header("Code Formatting Check (Black)")
 
     python_exe, _ = get_python_executable(project_root)
+    if py_files is None:
+        py_files = collect_python_files(project_root)
 
-    # Check if files need formatting
-    success, stdout, stderr = run_command(f'"{python_exe}" -m black --check --diff .', cwd=project_root)
+    # Check if files need formatting. Black ignores --extend-exclude for
+    # files named on the command line, so exclusions are applied by
+    # collect_python_files (EXCLUDED_DIRS) instead
+    success, stdout, stderr = run_command(
+        f'"{python_exe}" -m black --check --diff {format_file_args(py_files)}',
+        cwd=project_root
+    )
 
     if success:
         print_success("All files are properly formatted")
@@ -112,14 +138,19 @@ def run_code_formatting_check(project_root):
         print_warning("Run 'black .' to auto-format the code")
         return False
 
-def run_linting(project_root):
+def run_linting(project_root, py_files=None):
     """Run linting checks with flake8"""
     print_header("Linting Check (flake8)")
 
     python_exe, _ = get_python_executable(project_root)
+    if py_files is None:
+        py_files = collect_python_files(project_root)
 
     # Run flake8
-    success, stdout, stderr = run_command(f'"{python_exe}" -m flake8 . --count --statistics', cwd=project_root)
+    success, stdout, stderr = run_command(
+        f'"{python_exe}" -m flake8 --count --statistics {format_file_args(py_files)}',
+        cwd=project_root
+    )
 
     if success:
         print_success("No linting issues found")
@@ -178,6 +209,11 @@ def run_unit_tests(project_root, verbose=False):
     if verbose:
         pytest_args.append('-v')
 
+    # Spread the unit tests across CPU cores when pytest-xdist is installed
+    has_xdist, _, _ = run_command(f'"{python_exe}" -c "import xdist"')
+    if has_xdist:
+        pytest_args.extend(['-n', 'auto'])
+
     # Add coverage if available
     coverage_args = ['--cov=.', '--cov-report=term-missing', '--cov-report=html']
     pytest_command = ' '.join(pytest_args + coverage_args)
@@ -234,11 +270,13 @@ def run_integration_tests(project_root, verbose=False):
             print(stderr)
         return True  # Don't fail build on integration test issues
 
-def run_security_scan(project_root):
+def run_security_scan(project_root, py_files=None):
     """Run security scanning with bandit"""
     print_header("Security Scan (bandit)")
 
     python_exe, _ = get_python_executable(project_root)
+    if py_files is None:
+        py_files = collect_python_files(project_root)
 
     # Install bandit if not available
     print_status("Checking bandit availability...")
@@ -246,7 +284,10 @@ def run_security_scan(project_root):
 
     if install_success:
         # Run bandit security scan
-        success, stdout, stderr = run_command(f'"{python_exe}" -m bandit -r . -f text', cwd=project_root)
+        success, stdout, stderr = run_command(
+            f'"{python_exe}" -m bandit -f text {format_file_args(py_files)}',
+            cwd=project_root
+        )
 
         if success:
             print_success("Security scan passed - no issues found")
@@ -345,10 +386,13 @@ def main():
         if not check_virtual_environment(project_root):
             sys.exit(1)
 
+        # Walk the project tree once and share the file list between tools
+        py_files = collect_python_files(project_root)
+
         # Quick mode - only essential checks
         if args.quick:
             results["Unit Tests"] = run_unit_tests(project_root, args.verbose)
-            results["Code Formatting"] = run_code_formatting_check(project_root)
+            results["Code Formatting"] = run_code_formatting_check(project_root, py_files)
         # Unit tests only mode
         elif args.unit_only:
             results["Unit Tests"] = run_unit_tests(project_root, args.verbose)
@@ -356,10 +400,10 @@ def main():
         else:
             # Code quality checks
             if not args.skip_format:
-                results["Code Formatting"] = run_code_formatting_check(project_root)
+                results["Code Formatting"] = run_code_formatting_check(project_root, py_files)
 
             if not args.skip_lint:
-                results["Linting"] = run_linting(project_root)
+                results["Linting"] = run_linting(project_root, py_files)
 
             if not args.skip_type:
                 results["Type Checking"] = run_type_checking(project_root)
@@ -373,7 +417,7 @@ def main():
 
             # Security and dependencies
             if not args.skip_security:
-                results["Security Scan"] = run_security_scan(project_root)
+                results["Security Scan"] = run_security_scan(project_root, py_files)
 
             results["Dependency Check"] = run_dependency_check(project_root)
 
@@ -11,6 +11,7 @@ import os
 import sys
 import subprocess
 import platform
+import shutil
 import venv
 from pathlib import Path
 
@@ -58,6 +59,23 @@ def run_command(command, cwd=None, check=True):
             raise
         return e
 
+# Minimum pip version that does not need an upgrade during setup
+MIN_PIP_VERSION = (23, 0)
+
+def parse_version(version_string):
+    """Parse a dotted version string into a tuple of its leading integers"""
+    parts = []
+    for part in version_string.split("."):
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        if not digits:
+            break
+        parts.append(int(digits))
+    return tuple(parts)
+
 def check_python_version():
     """Check if Python version is compatible"""
     print_status("Checking Python version...")
@@ -74,13 +92,13 @@ def check_git():
     """Check if git is available"""
     print_status("Checking Git availability...")
 
-    try:
-        result = run_command("git --version")
-        print_success(f"Git is available: {result.stdout.strip()}")
+    git_path = shutil.which("git")
+    if git_path:
+        print_success(f"Git is available at {git_path}")
         return True
-    except subprocess.CalledProcessError:
-        print_warning("Git not found - some features may not work")
-        return False
+
+    print_warning("Git not found - some features may not work")
+    return False
 
 def create_virtual_environment(project_root):
     """Create Python virtual environment"""
@@ -122,9 +140,14 @@ def install_dependencies(project_root, venv_path):
         python_exe = venv_path / "bin" / "python"
         pip_exe = venv_path / "bin" / "pip"
 
-    # Upgrade pip first
-    print_status("Upgrading pip...")
-    run_command(f'"{python_exe}" -m pip install --upgrade pip')
+    # Upgrade pip first, but only when the installed version is too old
+    result = run_command(f'"{python_exe}" -c "import pip; print(pip.__version__)"', check=False)
+    pip_version = result.stdout.strip() if result.returncode == 0 else ""
+    if parse_version(pip_version) < MIN_PIP_VERSION:
+        print_status("Upgrading pip...")
+        run_command(f'"{python_exe}" -m pip install --upgrade pip')
+    else:
+        print_success(f"pip {pip_version} is up to date")
 
     # Install requirements
     print_status("Installing project dependencies...")
@@ -135,6 +158,7 @@ def install_dependencies(project_root, venv_path):
         "pytest",
         "pytest-asyncio",
         "pytest-cov",
+        "pytest-xdist",
         "black",
         "flake8",
         "mypy"
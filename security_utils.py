@@ -7,22 +7,141 @@ to prevent various security vulnerabilities such as path traversal, injection at
 and invalid input handling.
 """
 
+import functools
 import re
-import html
-import os
-from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-from urllib.parse import urlparse
+from enum import IntEnum
+import posixpath
+import string
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Translation table equivalent to html.escape(value, quote=True), applied in a
+# single pass instead of one str.replace() pass per special character
+_HTML_ESCAPE_TABLE = str.maketrans({
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&#x27;',
+})
+_HTML_SPECIAL_CHARS = frozenset('&<>"\'')
+
+# Exact types of JSON-RPC parameter values that cannot carry markup
+_PASSTHROUGH_TYPES = frozenset({int, float, bool, type(None)})
+
+# Vector values are sent to the plugin as [x, y, z]
+VECTOR_LENGTH = 3
+
+
+def _is_vector(value: Any) -> bool:
+    """True for a list or tuple of exactly VECTOR_LENGTH numbers"""
+    return (
+        isinstance(value, (list, tuple))
+        and len(value) == VECTOR_LENGTH
+        and all(isinstance(item, (int, float)) for item in value)
+    )
+
+
+def _escape_html(value: str) -> str:
+    """Escape HTML special characters, returning plain strings unchanged"""
+    if _HTML_SPECIAL_CHARS.isdisjoint(value):
+        return value
+    return value.translate(_HTML_ESCAPE_TABLE)
+
+
+class ErrorCode(IntEnum):
+    """Machine-readable reason for a validation failure"""
+    EMPTY = 1
+    NOT_A_STRING = 2
+    TOO_LONG = 3
+    INVALID_FORMAT = 4
+    RESERVED_KEYWORD = 5
+    DANGEROUS_CONTENT = 6
+    INVALID_PREFIX = 7
+    PATH_TRAVERSAL = 8
+    DANGEROUS_CHARACTER = 9
+    INVALID_PARENT_CLASS = 10
+    INVALID_SCHEME = 11
+    INVALID_HOSTNAME = 12
+
+
+class ValidationResult(NamedTuple):
+    """
+    Immutable result of a SecurityValidator check.
+
+    Fields can also be read by key (result["valid"]) so code written against
+    the previous dict results keeps working. 'errors' holds the human-readable
+    messages and 'error_codes' the matching ErrorCode members.
+    """
+    valid: bool
+    errors: Tuple[str, ...] = ()
+    sanitized_value: Any = None
+    normalized_path: Optional[str] = None
+    error_codes: FrozenSet[ErrorCode] = frozenset()
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            if key not in self._fields:
+                raise KeyError(key)
+            return getattr(self, key)
+        return tuple.__getitem__(self, key)
+
+
+# Shared result for checks that pass without producing a value
+_VALID_RESULT = ValidationResult(True)
+
+
+def _failure(*issues: Tuple[ErrorCode, str], **fields) -> ValidationResult:
+    """Build a failed ValidationResult from (code, message) pairs"""
+    return ValidationResult(
+        False,
+        tuple(message for _, message in issues),
+        error_codes=frozenset(code for code, _ in issues),
+        **fields
+    )
+
+# Number of distinct inputs remembered per cached validator
+VALIDATION_CACHE_SIZE = 1024
+
+
+def _cached_validator(func):
+    """
+    Memoize a single-argument validator for plain string inputs.
+
+    Validators are pure and their results immutable, so repeated names and
+    paths are answered from an LRU cache. Other input types (which may be
+    unhashable) are validated directly.
+    """
+    cached = functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)(func)
+
+    @functools.wraps(func)
+    def wrapper(value):
+        if type(value) is str:
+            return cached(value)
+        return func(value)
+
+    wrapper.cache_info = cached.cache_info
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
 
 
 class SecurityValidator:
     """Security validation utilities for input sanitization and validation"""
 
     # Valid blueprint name pattern: starts with letter, alphanumeric + underscore only
-    BLUEPRINT_NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+    BLUEPRINT_NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*\Z')
+
+    # Characters a blueprint or property name may start with. Checked before
+    # the patterns so names with a bad first character skip the regex engine
+    NAME_START_CHARS = frozenset(string.ascii_letters)
 
     # Valid property name pattern: similar to blueprint name
-    PROPERTY_NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+    PROPERTY_NAME_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9_]*\Z')
+
+    # Valid JSON-RPC parameter key: alphanumeric and underscore only.
+    # \Z (rather than $) so a trailing newline is not accepted
+    JSON_RPC_KEY_PATTERN = re.compile(r'^[A-Za-z0-9_]+\Z')
 
     # Maximum length constraints
     MAX_BLUEPRINT_NAME_LENGTH = 64
@@ -30,18 +149,76 @@ class SecurityValidator:
     MAX_PROPERTY_VALUE_LENGTH = 1024
     MAX_ASSET_PATH_LENGTH = 256
 
+    # Names that collide with C++ keywords (compared case-insensitively)
+    RESERVED_KEYWORDS = frozenset({"class", "struct", "enum", "namespace", "using", "template"})
+
+    # Fully valid blueprint name in a single match: format, length bound and
+    # reserved keyword exclusion. Used as a fast path before the detailed checks
+    VALID_BLUEPRINT_NAME_PATTERN = re.compile(
+        r'(?!(?:' + '|'.join(sorted(RESERVED_KEYWORDS)) + r')\Z)'
+        r'[A-Za-z][A-Za-z0-9_]{0,' + str(MAX_BLUEPRINT_NAME_LENGTH - 1) + r'}\Z',
+        re.IGNORECASE
+    )
+
+    # Fully valid property name (format and length bound) in a single match
+    VALID_PROPERTY_NAME_PATTERN = re.compile(
+        r'[A-Za-z][A-Za-z0-9_]{0,' + str(MAX_PROPERTY_NAME_LENGTH - 1) + r'}\Z'
+    )
+
     # Valid asset path pattern: must start with /Game/ and contain only valid chars
     ASSET_PATH_PATTERN = re.compile(r'^/Game/[A-Za-z0-9_/]+/$')
 
+    # Potential script injection patterns, combined into a single alternation
+    # so each property value is scanned once
+    DANGEROUS_CONTENT_PATTERN = re.compile(
+        r'<script[^>]*>'
+        r'|<iframe\b'
+        r'|javascript:'
+        r'|vbscript:'
+        r'|onload\s*='
+        r'|onerror\s*='
+        r'|eval\s*\('
+        r'|expression\s*\(',
+        re.IGNORECASE
+    )
+
+    # Every DANGEROUS_CONTENT_PATTERN alternative contains one of these
+    # characters, so values without any of them need no regex scan
+    DANGEROUS_CONTENT_CHARS = frozenset('<:=(')
+
+    # Asset path made only of plain /Game/ segments (no dots, doubled slashes
+    # or special characters). Such a path needs no further checks
+    SIMPLE_ASSET_PATH_PATTERN = re.compile(r'^/Game/(?:[A-Za-z0-9_]+/)*[A-Za-z0-9_]*\Z')
+
+    # Characters that are never valid in an asset path
+    UNSAFE_ASSET_PATH_CHARS = frozenset('<>"|?*\x00')
+
     # Valid parent classes (whitelist approach for security)
-    VALID_PARENT_CLASSES = {
+    VALID_PARENT_CLASSES = frozenset({
         "Actor", "Pawn", "Character", "ActorComponent", "SceneComponent",
         "UserWidget", "Object", "StaticMeshActor", "GameModeBase",
         "PlayerController", "GameState", "PlayerState"
-    }
+    })
+
+    # Suffix for invalid parent class errors, built once from the whitelist
+    VALID_PARENT_CLASSES_HINT = "Must be one of: " + ", ".join(sorted(VALID_PARENT_CLASSES))
+
+    # Valid blueprint creation parameters joined as "name|parent|path", matched
+    # in one pass: name as VALID_BLUEPRINT_NAME_PATTERN, a whitelisted parent
+    # class (case-sensitive) and a path as SIMPLE_ASSET_PATH_PATTERN
+    CREATION_PARAMS_PATTERN = re.compile(
+        r'(?!(?i:' + '|'.join(sorted(RESERVED_KEYWORDS)) + r')\|)'
+        r'[A-Za-z][A-Za-z0-9_]{0,' + str(MAX_BLUEPRINT_NAME_LENGTH - 1) + r'}'
+        r'\|(?:' + '|'.join(map(re.escape, sorted(VALID_PARENT_CLASSES))) + r')'
+        r'\|/Game/(?:[A-Za-z0-9_]+/)*[A-Za-z0-9_]*\Z'
+    )
+
+    # Allowed URL schemes for WebSocket connections
+    WEBSOCKET_URL_SCHEMES = frozenset({"ws", "wss"})
 
     @staticmethod
-    def validate_blueprint_name(name: str) -> Dict[str, Any]:
+    @_cached_validator
+    def validate_blueprint_name(name: str) -> ValidationResult:
         """
         Validate blueprint name for security and format compliance.
 
@@ -49,35 +226,40 @@ class SecurityValidator:
             name: Blueprint name to validate
 
         Returns:
-            Dict with 'valid' boolean and 'errors' list
+            ValidationResult with 'valid' and 'errors'
         """
-        errors = []
-
         if not name:
-            errors.append("Blueprint name cannot be empty")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.EMPTY, "Blueprint name cannot be empty"))
 
         if not isinstance(name, str):
-            errors.append("Blueprint name must be a string")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.NOT_A_STRING, "Blueprint name must be a string"))
+
+        starts_with_letter = name[0] in SecurityValidator.NAME_START_CHARS
+
+        # Fast path: a single match accepts the common valid case
+        if (starts_with_letter and len(name) <= SecurityValidator.MAX_BLUEPRINT_NAME_LENGTH
+                and SecurityValidator.VALID_BLUEPRINT_NAME_PATTERN.match(name)):
+            return _VALID_RESULT
+
+        errors = []
 
         # Length check
         if len(name) > SecurityValidator.MAX_BLUEPRINT_NAME_LENGTH:
-            errors.append(f"Blueprint name too long (max {SecurityValidator.MAX_BLUEPRINT_NAME_LENGTH} characters)")
+            errors.append((ErrorCode.TOO_LONG, f"Blueprint name too long (max {SecurityValidator.MAX_BLUEPRINT_NAME_LENGTH} characters)"))
 
         # Pattern check
-        if not SecurityValidator.BLUEPRINT_NAME_PATTERN.match(name):
-            errors.append("Blueprint name must start with a letter and contain only letters, numbers, and underscores")
+        if not starts_with_letter or not SecurityValidator.BLUEPRINT_NAME_PATTERN.match(name):
+            errors.append((ErrorCode.INVALID_FORMAT, "Blueprint name must start with a letter and contain only letters, numbers, and underscores"))
 
         # Reserved keywords check
-        reserved_keywords = {"class", "struct", "enum", "namespace", "using", "template"}
-        if name.lower() in reserved_keywords:
-            errors.append(f"Blueprint name '{name}' is a reserved keyword")
+        if name.lower() in SecurityValidator.RESERVED_KEYWORDS:
+            errors.append((ErrorCode.RESERVED_KEYWORD, f"Blueprint name '{name}' is a reserved keyword"))
 
-        return {"valid": len(errors) == 0, "errors": errors}
+        return _failure(*errors) if errors else _VALID_RESULT
 
     @staticmethod
-    def validate_property_name(name: str) -> Dict[str, Any]:
+    @_cached_validator
+    def validate_property_name(name: str) -> ValidationResult:
         """
         Validate property name for security and format compliance.
 
@@ -85,30 +267,35 @@ class SecurityValidator:
             name: Property name to validate
 
         Returns:
-            Dict with 'valid' boolean and 'errors' list
+            ValidationResult with 'valid' and 'errors'
         """
-        errors = []
-
         if not name:
-            errors.append("Property name cannot be empty")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.EMPTY, "Property name cannot be empty"))
 
         if not isinstance(name, str):
-            errors.append("Property name must be a string")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.NOT_A_STRING, "Property name must be a string"))
+
+        starts_with_letter = name[0] in SecurityValidator.NAME_START_CHARS
+
+        # Fast path: a single match accepts the common valid case
+        if (starts_with_letter and len(name) <= SecurityValidator.MAX_PROPERTY_NAME_LENGTH
+                and SecurityValidator.VALID_PROPERTY_NAME_PATTERN.match(name)):
+            return _VALID_RESULT
+
+        errors = []
 
         # Length check
         if len(name) > SecurityValidator.MAX_PROPERTY_NAME_LENGTH:
-            errors.append(f"Property name too long (max {SecurityValidator.MAX_PROPERTY_NAME_LENGTH} characters)")
+            errors.append((ErrorCode.TOO_LONG, f"Property name too long (max {SecurityValidator.MAX_PROPERTY_NAME_LENGTH} characters)"))
 
         # Pattern check
-        if not SecurityValidator.PROPERTY_NAME_PATTERN.match(name):
-            errors.append("Property name must start with a letter and contain only letters, numbers, and underscores")
+        if not starts_with_letter or not SecurityValidator.PROPERTY_NAME_PATTERN.match(name):
+            errors.append((ErrorCode.INVALID_FORMAT, "Property name must start with a letter and contain only letters, numbers, and underscores"))
 
-        return {"valid": len(errors) == 0, "errors": errors}
+        return _failure(*errors) if errors else _VALID_RESULT
 
     @staticmethod
-    def validate_property_value(value: Any, max_length: int = None) -> Dict[str, Any]:
+    def validate_property_value(value: Any, max_length: int = None) -> ValidationResult:
         """
         Validate and sanitize property value.
 
@@ -117,48 +304,50 @@ class SecurityValidator:
             max_length: Maximum string length (defaults to MAX_PROPERTY_VALUE_LENGTH)
 
         Returns:
-            Dict with 'valid' boolean, 'errors' list, and 'sanitized_value'
+            ValidationResult with 'valid', 'errors' and 'sanitized_value'
         """
-        errors = []
         max_length = max_length or SecurityValidator.MAX_PROPERTY_VALUE_LENGTH
 
         if value is None:
-            return {"valid": True, "errors": [], "sanitized_value": ""}
+            return ValidationResult(True, sanitized_value="")
 
         # Convert to string for validation
         str_value = str(value)
 
         # Length check
         if len(str_value) > max_length:
-            errors.append(f"Property value too long (max {max_length} characters)")
-            return {"valid": False, "errors": errors, "sanitized_value": None}
+            return _failure((ErrorCode.TOO_LONG, f"Property value too long (max {max_length} characters)"))
 
-        # HTML escape for XSS prevention
-        sanitized_value = html.escape(str_value, quote=True)
+        # Numbers (and bools) cannot carry markup; the plugin reads scalar
+        # property values as strings
+        if isinstance(value, (int, float)):
+            return ValidationResult(True, sanitized_value=str_value)
+        if isinstance(value, (list, tuple)):
+            if not _is_vector(value):
+                return _failure((ErrorCode.INVALID_FORMAT, f"Vector values must be exactly {VECTOR_LENGTH} numbers"))
+            return ValidationResult(True, sanitized_value=list(value))
+
+        return SecurityValidator._validate_property_text(str_value)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=VALIDATION_CACHE_SIZE)
+    def _validate_property_text(str_value: str) -> ValidationResult:
+        """Injection check and HTML escaping for a length-checked property value"""
+        # Plain text cannot contain any of the injection patterns
+        if SecurityValidator.DANGEROUS_CONTENT_CHARS.isdisjoint(str_value):
+            return ValidationResult(True, sanitized_value=_escape_html(str_value))
 
         # Check for potential injection patterns
-        dangerous_patterns = [
-            r'<script[^>]*>',
-            r'javascript:',
-            r'vbscript:',
-            r'onload\s*=',
-            r'onerror\s*=',
-            r'eval\s*\(',
-            r'expression\s*\(',
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, str_value, re.IGNORECASE):
-                errors.append(f"Property value contains potentially dangerous content: {pattern}")
-
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "sanitized_value": sanitized_value
-        }
+        match = SecurityValidator.DANGEROUS_CONTENT_PATTERN.search(str_value)
+        if match:
+            return _failure((ErrorCode.DANGEROUS_CONTENT, f"Property value contains potentially dangerous content: {match.group(0)!r}"))
+
+        # HTML escape for XSS prevention
+        return ValidationResult(True, sanitized_value=_escape_html(str_value))
 
     @staticmethod
-    def validate_asset_path(path: str) -> Dict[str, Any]:
+    @_cached_validator
+    def validate_asset_path(path: str) -> ValidationResult:
         """
         Validate asset path for security (path traversal prevention).
 
@@ -166,42 +355,46 @@ class SecurityValidator:
             path: Asset path to validate
 
         Returns:
-            Dict with 'valid' boolean, 'errors' list, and 'normalized_path'
+            ValidationResult with 'valid', 'errors' and 'normalized_path'
         """
-        errors = []
-
         if not path:
-            errors.append("Asset path cannot be empty")
-            return {"valid": False, "errors": errors, "normalized_path": None}
+            return _failure((ErrorCode.EMPTY, "Asset path cannot be empty"))
 
         if not isinstance(path, str):
-            errors.append("Asset path must be a string")
-            return {"valid": False, "errors": errors, "normalized_path": None}
+            return _failure((ErrorCode.NOT_A_STRING, "Asset path must be a string"))
+
+        # Fast path: prefix, allowed characters and traversal are covered by one match
+        if (len(path) <= SecurityValidator.MAX_ASSET_PATH_LENGTH
+                and SecurityValidator.SIMPLE_ASSET_PATH_PATTERN.match(path)):
+            normalized = path if path.endswith('/') else path + '/'
+            return ValidationResult(True, normalized_path=normalized)
+
+        errors = []
 
         # Length check
         if len(path) > SecurityValidator.MAX_ASSET_PATH_LENGTH:
-            errors.append(f"Asset path too long (max {SecurityValidator.MAX_ASSET_PATH_LENGTH} characters)")
+            errors.append((ErrorCode.TOO_LONG, f"Asset path too long (max {SecurityValidator.MAX_ASSET_PATH_LENGTH} characters)"))
 
         # Must start with /Game/
         if not path.startswith('/Game/'):
-            errors.append("Asset path must start with '/Game/'")
+            errors.append((ErrorCode.INVALID_PREFIX, "Asset path must start with '/Game/'"))
 
-        # Normalize path to prevent traversal attacks
+        # Normalize path to prevent traversal attacks. Asset paths always use
+        # forward slashes, so normalize with posixpath on every platform
         try:
-            normalized = os.path.normpath(path)
+            normalized = posixpath.normpath(path)
         except (ValueError, TypeError):
-            errors.append("Invalid asset path format")
-            return {"valid": False, "errors": errors, "normalized_path": None}
+            errors.append((ErrorCode.INVALID_FORMAT, "Invalid asset path format"))
+            return _failure(*errors)
 
         # Check for path traversal attempts
         if '..' in path:
-            errors.append("Path traversal detected in asset path")
+            errors.append((ErrorCode.PATH_TRAVERSAL, "Path traversal detected in asset path"))
 
         # Check for dangerous characters
-        dangerous_chars = ['<', '>', '"', '|', '?', '*', '\x00']
-        for char in dangerous_chars:
-            if char in path:
-                errors.append(f"Asset path contains dangerous character: {char}")
+        unsafe = SecurityValidator.UNSAFE_ASSET_PATH_CHARS.intersection(path)
+        for char in sorted(unsafe):
+            errors.append((ErrorCode.DANGEROUS_CHARACTER, f"Asset path contains dangerous character: {char!r}"))
 
         # Ensure it ends with / for directory paths (if original path didn't end with /)
         if not path.endswith('/'):
@@ -209,14 +402,13 @@ class SecurityValidator:
         else:
             normalized = path
 
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "normalized_path": normalized
-        }
+        if errors:
+            return _failure(*errors, normalized_path=normalized)
+        return ValidationResult(True, normalized_path=normalized)
 
     @staticmethod
-    def validate_parent_class(parent_class: str) -> Dict[str, Any]:
+    @_cached_validator
+    def validate_parent_class(parent_class: str) -> ValidationResult:
         """
         Validate parent class against whitelist.
 
@@ -224,22 +416,60 @@ class SecurityValidator:
             parent_class: Parent class name to validate
 
         Returns:
-            Dict with 'valid' boolean and 'errors' list
+            ValidationResult with 'valid' and 'errors'
         """
-        errors = []
-
         if not parent_class:
-            errors.append("Parent class cannot be empty")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.EMPTY, "Parent class cannot be empty"))
 
         if not isinstance(parent_class, str):
-            errors.append("Parent class must be a string")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.NOT_A_STRING, "Parent class must be a string"))
+
+        if parent_class in SecurityValidator.VALID_PARENT_CLASSES:
+            return _VALID_RESULT
+
+        return _failure((
+            ErrorCode.INVALID_PARENT_CLASS,
+            f"Invalid parent class '{parent_class}'. {SecurityValidator.VALID_PARENT_CLASSES_HINT}",
+        ))
+
+    @staticmethod
+    def validate_creation_batch(blueprint_name: str, parent_class: str, asset_path: str) -> ValidationResult:
+        """
+        Validate blueprint name, parent class and asset path together.
+
+        Valid parameters are accepted with a single match; otherwise each one
+        is checked individually so that every error is reported.
 
-        if parent_class not in SecurityValidator.VALID_PARENT_CLASSES:
-            errors.append(f"Invalid parent class '{parent_class}'. Must be one of: {', '.join(sorted(SecurityValidator.VALID_PARENT_CLASSES))}")
+        Args:
+            blueprint_name: Name of the blueprint
+            parent_class: Parent class for the blueprint
+            asset_path: Asset path where blueprint will be created
 
-        return {"valid": len(errors) == 0, "errors": errors}
+        Returns:
+            ValidationResult with 'valid', 'errors' and 'normalized_path'
+        """
+        if (type(blueprint_name) is str and type(parent_class) is str and type(asset_path) is str
+                and len(asset_path) <= SecurityValidator.MAX_ASSET_PATH_LENGTH
+                and SecurityValidator.CREATION_PARAMS_PATTERN.match(
+                    f"{blueprint_name}|{parent_class}|{asset_path}")):
+            normalized = asset_path if asset_path.endswith('/') else asset_path + '/'
+            return ValidationResult(True, normalized_path=normalized)
+
+        # Checks run cheapest first; errors are still collected from all of them
+        path_result = SecurityValidator.validate_asset_path(asset_path)
+        results = (
+            SecurityValidator.validate_parent_class(parent_class),
+            SecurityValidator.validate_blueprint_name(blueprint_name),
+            path_result,
+        )
+        errors = tuple(error for result in results for error in result.errors)
+
+        return ValidationResult(
+            not errors,
+            errors,
+            normalized_path=path_result.normalized_path,
+            error_codes=frozenset().union(*(result.error_codes for result in results))
+        )
 
     @staticmethod
     def sanitize_json_rpc_params(params: Dict[str, Any]) -> Dict[str, Any]:
@@ -255,20 +485,29 @@ class SecurityValidator:
         if not isinstance(params, dict):
             return {}
 
+        key_match = SecurityValidator.JSON_RPC_KEY_PATTERN.match
         sanitized = {}
         for key, value in params.items():
             # Sanitize key - allow alphanumeric and underscore
-            if isinstance(key, str) and re.match(r'^[A-Za-z0-9_]+$', key):
-                # Sanitize value
-                if isinstance(value, str):
-                    sanitized[key] = html.escape(value, quote=True)
-                elif isinstance(value, (int, float, bool)):
+            if isinstance(key, str) and key_match(key):
+                # Sanitize value; numbers, bools and None pass through untouched
+                if type(value) in _PASSTHROUGH_TYPES:
                     sanitized[key] = value
-                elif value is None:
-                    sanitized[key] = None
+                elif isinstance(value, str):
+                    sanitized[key] = _escape_html(value)
+                elif isinstance(value, (int, float)):
+                    # Subclasses such as IntEnum
+                    sanitized[key] = value
+                elif _is_vector(value):
+                    # Vectors such as [x, y, z] stay JSON arrays of numbers
+                    sanitized[key] = list(value)
+                elif isinstance(value, dict):
+                    # Nested objects such as a "properties" map keep their
+                    # structure; their keys and values follow the same rules
+                    sanitized[key] = SecurityValidator.sanitize_json_rpc_params(value)
                 else:
                     # Convert other types to string and sanitize
-                    sanitized[key] = html.escape(str(value), quote=True)
+                    sanitized[key] = _escape_html(str(value))
 
         return sanitized
 
@@ -287,10 +526,19 @@ class SecurityValidator:
         if not isinstance(message, str):
             return False
 
+        # Every character needs at least one and at most four UTF-8 bytes, so
+        # the encoded size only has to be computed when it is ambiguous
+        char_count = len(message)
+        if char_count > max_size:
+            return False
+        if char_count * 4 <= max_size:
+            return True
+
         return len(message.encode('utf-8')) <= max_size
 
     @staticmethod
-    def validate_url(url: str) -> Dict[str, Any]:
+    @_cached_validator
+    def validate_url(url: str) -> ValidationResult:
         """
         Validate URL format and security.
 
@@ -298,29 +546,49 @@ class SecurityValidator:
             url: URL to validate
 
         Returns:
-            Dict with 'valid' boolean and 'errors' list
+            ValidationResult with 'valid' and 'errors'
         """
-        errors = []
-
         if not url:
-            errors.append("URL cannot be empty")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.EMPTY, "URL cannot be empty"))
+
+        # Fast path: plain scheme://host[:port][/path] URLs are checked by
+        # slicing, which also rejects http://, ftp:// etc. without parsing;
+        # anything unusual (credentials, IPv6 literals, whitespace, schemes
+        # with digits or symbols) falls through to urlsplit below
+        if isinstance(url, str):
+            scheme, separator, rest = url.partition('://')
+            if separator and scheme.isascii() and scheme.isalpha():
+                end = len(rest)
+                for delimiter in '/?#':
+                    index = rest.find(delimiter, 0, end)
+                    if index != -1:
+                        end = index
+                authority = rest[:end]
+                if ('@' not in authority and '[' not in authority
+                        and ' ' not in authority and authority.isprintable()):
+                    errors = []
+                    if scheme.lower() not in SecurityValidator.WEBSOCKET_URL_SCHEMES:
+                        errors.append((ErrorCode.INVALID_SCHEME, "URL must use 'ws://' or 'wss://' protocol"))
+                    if not authority.partition(':')[0]:
+                        errors.append((ErrorCode.INVALID_HOSTNAME, "URL must have a valid hostname"))
+                    return _failure(*errors) if errors else _VALID_RESULT
 
         try:
-            parsed = urlparse(url)
+            parsed = urlsplit(url)
         except Exception:
-            errors.append("Invalid URL format")
-            return {"valid": False, "errors": errors}
+            return _failure((ErrorCode.INVALID_FORMAT, "Invalid URL format"))
+
+        errors = []
 
         # Only allow websocket protocols
-        if parsed.scheme not in ['ws', 'wss']:
-            errors.append("URL must use 'ws://' or 'wss://' protocol")
+        if parsed.scheme not in SecurityValidator.WEBSOCKET_URL_SCHEMES:
+            errors.append((ErrorCode.INVALID_SCHEME, "URL must use 'ws://' or 'wss://' protocol"))
 
         # Validate hostname (basic check)
         if not parsed.hostname:
-            errors.append("URL must have a valid hostname")
+            errors.append((ErrorCode.INVALID_HOSTNAME, "URL must have a valid hostname"))
 
-        return {"valid": len(errors) == 0, "errors": errors}
+        return _failure(*errors) if errors else _VALID_RESULT
 
 
 class SecurityError(Exception):
@@ -328,7 +596,7 @@ class SecurityError(Exception):
 
     def __init__(self, message: str, errors: List[str] = None):
         super().__init__(message)
-        self.errors = errors or []
+        self.errors = errors if errors is not None else []
 
 
 def validate_blueprint_creation_params(blueprint_name: str, parent_class: str, asset_path: str) -> None:
@@ -343,25 +611,9 @@ def validate_blueprint_creation_params(blueprint_name: str, parent_class: str, a
     Raises:
         SecurityError: If any validation fails
     """
-    all_errors = []
-
-    # Validate blueprint name
-    name_result = SecurityValidator.validate_blueprint_name(blueprint_name)
-    if not name_result["valid"]:
-        all_errors.extend(name_result["errors"])
-
-    # Validate parent class
-    parent_result = SecurityValidator.validate_parent_class(parent_class)
-    if not parent_result["valid"]:
-        all_errors.extend(parent_result["errors"])
-
-    # Validate asset path
-    path_result = SecurityValidator.validate_asset_path(asset_path)
-    if not path_result["valid"]:
-        all_errors.extend(path_result["errors"])
-
-    if all_errors:
-        raise SecurityError("Blueprint creation parameters validation failed", all_errors)
+    result = SecurityValidator.validate_creation_batch(blueprint_name, parent_class, asset_path)
+    if not result.valid:
+        raise SecurityError("Blueprint creation parameters validation failed", list(result.errors))
 
 
 def validate_property_setting_params(blueprint_path: str, property_name: str, property_value: Any) -> Dict[str, Any]:
@@ -384,24 +636,24 @@ def validate_property_setting_params(blueprint_path: str, property_name: str, pr
 
     # Validate blueprint path
     path_result = SecurityValidator.validate_asset_path(blueprint_path)
-    if not path_result["valid"]:
-        all_errors.extend(path_result["errors"])
+    if not path_result.valid:
+        all_errors.extend(path_result.errors)
     else:
-        sanitized_values["blueprint_path"] = path_result["normalized_path"]
+        sanitized_values["blueprint_path"] = path_result.normalized_path
 
     # Validate property name
     name_result = SecurityValidator.validate_property_name(property_name)
-    if not name_result["valid"]:
-        all_errors.extend(name_result["errors"])
+    if not name_result.valid:
+        all_errors.extend(name_result.errors)
     else:
         sanitized_values["property_name"] = property_name
 
     # Validate and sanitize property value
     value_result = SecurityValidator.validate_property_value(property_value)
-    if not value_result["valid"]:
-        all_errors.extend(value_result["errors"])
+    if not value_result.valid:
+        all_errors.extend(value_result.errors)
     else:
-        sanitized_values["property_value"] = value_result["sanitized_value"]
+        sanitized_values["property_value"] = value_result.sanitized_value
 
     if all_errors:
         raise SecurityError("Property setting parameters validation failed", all_errors)
@@ -13,36 +13,105 @@ import asyncio
 import websockets
 import json
 import logging
+import time
+import weakref
 from datetime import datetime
+from types import MappingProxyType
 from typing import Dict, Any, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Use orjson when available; responses stay text (str) because the Unreal
+# plugin only listens for text WebSocket frames
+if orjson is not None:
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
+# Shared read-only params for requests that omit them
+_EMPTY_PARAMS = MappingProxyType({})
+
+# Static portion of the get_server_status result, built once at import time
+_STATUS_TEMPLATE = {
+    "online": True,
+    "version": "1.0.0-test",
+    "server_name": "MCPTestServer",
+    "uptime": "N/A",
+    "supported_operations": (
+        "create_blueprint",
+        "set_property",
+        "add_component",
+        "compile_blueprint",
+        "get_server_status"
+    ),
+    "supported_parent_classes": (
+        "Actor",
+        "Pawn",
+        "Character",
+        "ActorComponent",
+        "SceneComponent",
+        "UserWidget",
+        "Object"
+    ),
+}
+
 class MCPTestServer:
     """Test MCP Server implementation for Unreal Engine plugin testing"""
 
+    # How long a formatted timestamp may be reused, in seconds
+    TIMESTAMP_RESOLUTION = 0.01
+
     def __init__(self, host: str = "localhost", port: int = 8080):
         self.host = host
         self.port = port
-        self.connected_clients = set()
+        # Weak references so a client that is never unregistered cannot leak
+        self.connected_clients = weakref.WeakSet()
+        self._now_iso = ""
+        self._now_iso_at = float("-inf")
+
+        # JSON-RPC method name -> handler coroutine
+        self._handlers = {
+            "create_blueprint": self.handle_create_blueprint,
+            "set_property": self.handle_set_property,
+            "add_component": self.handle_add_component,
+            "compile_blueprint": self.handle_compile_blueprint,
+            "get_server_status": self.handle_get_server_status,
+        }
+
+    def current_timestamp(self) -> str:
+        """Return the current time in ISO format, reformatted at most every TIMESTAMP_RESOLUTION seconds"""
+        now = time.monotonic()
+        if now - self._now_iso_at >= self.TIMESTAMP_RESOLUTION:
+            self._now_iso = datetime.now().isoformat()
+            self._now_iso_at = now
+        return self._now_iso
 
     async def register_client(self, websocket):
         """Register a new client connection"""
         self.connected_clients.add(websocket)
-        logger.info(f"Client connected from {websocket.remote_address}")
+        logger.info("Client connected from %s", websocket.remote_address)
 
     async def unregister_client(self, websocket):
         """Unregister a client connection"""
         self.connected_clients.discard(websocket)
-        logger.info(f"Client disconnected from {websocket.remote_address}")
+        logger.info("Client disconnected from %s", websocket.remote_address)
 
     async def handle_message(self, websocket, message: str) -> Optional[str]:
         """Handle incoming JSON-RPC 2.0 message from client"""
         try:
-            data = json.loads(message)
-            logger.info(f"Received message: {data}")
+            data = _json_loads(message)
+            logger.info("Received message: %s", data)
 
             # Validate JSON-RPC 2.0 format
             if not self.validate_jsonrpc(data):
@@ -51,26 +120,18 @@ class MCPTestServer:
             # Extract request details
             request_id = data.get("id")
             method = data.get("method")
-            params = data.get("params", {})
+            params = data.get("params") or _EMPTY_PARAMS
 
             # Process the request
-            if method == "create_blueprint":
-                return await self.handle_create_blueprint(request_id, params)
-            elif method == "set_property":
-                return await self.handle_set_property(request_id, params)
-            elif method == "add_component":
-                return await self.handle_add_component(request_id, params)
-            elif method == "compile_blueprint":
-                return await self.handle_compile_blueprint(request_id, params)
-            elif method == "get_server_status":
-                return await self.handle_get_server_status(request_id, params)
-            else:
+            handler = self._handlers.get(method)
+            if handler is None:
                 return self.create_error_response(request_id, -32601, f"Method not found: {method}")
+            return await handler(request_id, params)
 
         except json.JSONDecodeError:
             return self.create_error_response(None, -32700, "Parse error")
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
             return self.create_error_response(None, -32603, "Internal error")
 
     def validate_jsonrpc(self, data: Dict[str, Any]) -> bool:
@@ -89,7 +150,7 @@ class MCPTestServer:
             "id": request_id,
             "result": result
         }
-        return json.dumps(response)
+        return _json_dumps(response)
 
     def create_error_response(self, request_id: Optional[str], code: int, message: str) -> str:
         """Create an error JSON-RPC 2.0 response"""
@@ -101,7 +162,7 @@ class MCPTestServer:
                 "message": message
             }
         }
-        return json.dumps(response)
+        return _json_dumps(response)
 
     async def handle_create_blueprint(self, request_id: str, params: Dict[str, Any]) -> str:
         """Handle create_blueprint request"""
@@ -109,7 +170,7 @@ class MCPTestServer:
         parent_class = params.get("parent_class", "Actor")
         asset_path = params.get("asset_path", "/Game/Blueprints/")
 
-        logger.info(f"Creating blueprint: {blueprint_name} (parent: {parent_class}) at {asset_path}")
+        logger.info("Creating blueprint: %s (parent: %s) at %s", blueprint_name, parent_class, asset_path)
 
         # Simulate blueprint creation
         await asyncio.sleep(0.1)  # Simulate processing time
@@ -119,7 +180,7 @@ class MCPTestServer:
             "message": f"Blueprint '{blueprint_name}' created successfully",
             "blueprint_path": f"{asset_path}{blueprint_name}",
             "parent_class": parent_class,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.current_timestamp()
         }
 
         return self.create_success_response(request_id, result)
@@ -130,7 +191,7 @@ class MCPTestServer:
         property_name = params.get("property_name", "")
         property_value = params.get("property_value", "")
 
-        logger.info(f"Setting property {property_name} = {property_value} on {blueprint_path}")
+        logger.info("Setting property %s = %s on %s", property_name, property_value, blueprint_path)
 
         # Simulate property setting
         await asyncio.sleep(0.05)
@@ -139,7 +200,7 @@ class MCPTestServer:
             "success": True,
             "message": f"Property '{property_name}' set to '{property_value}'",
             "blueprint_path": blueprint_path,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.current_timestamp()
         }
 
         return self.create_success_response(request_id, result)
@@ -150,7 +211,7 @@ class MCPTestServer:
         component_type = params.get("component_type", "")
         component_name = params.get("component_name", "")
 
-        logger.info(f"Adding component {component_name} ({component_type}) to {blueprint_path}")
+        logger.info("Adding component %s (%s) to %s", component_name, component_type, blueprint_path)
 
         # Simulate component addition
         await asyncio.sleep(0.1)
@@ -161,7 +222,7 @@ class MCPTestServer:
             "blueprint_path": blueprint_path,
             "component_name": component_name,
             "component_type": component_type,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.current_timestamp()
         }
 
         return self.create_success_response(request_id, result)
@@ -170,7 +231,7 @@ class MCPTestServer:
         """Handle compile_blueprint request"""
         blueprint_path = params.get("blueprint_path", "")
 
-        logger.info(f"Compiling blueprint: {blueprint_path}")
+        logger.info("Compiling blueprint: %s", blueprint_path)
 
         # Simulate compilation
         await asyncio.sleep(0.2)
@@ -180,7 +241,7 @@ class MCPTestServer:
             "message": f"Blueprint '{blueprint_path}' compiled successfully",
             "blueprint_path": blueprint_path,
             "compilation_time": "0.2s",
-            "timestamp": datetime.now().isoformat()
+            "timestamp": self.current_timestamp()
         }
 
         return self.create_success_response(request_id, result)
@@ -189,55 +250,54 @@ class MCPTestServer:
         """Handle get_server_status request"""
         logger.info("Getting server status")
 
-        result = {
-            "online": True,
-            "version": "1.0.0-test",
-            "server_name": "MCPTestServer",
-            "uptime": "N/A",
-            "connected_clients": len(self.connected_clients),
-            "supported_operations": [
-                "create_blueprint",
-                "set_property",
-                "add_component",
-                "compile_blueprint",
-                "get_server_status"
-            ],
-            "supported_parent_classes": [
-                "Actor",
-                "Pawn",
-                "Character",
-                "ActorComponent",
-                "SceneComponent",
-                "UserWidget",
-                "Object"
-            ],
-            "timestamp": datetime.now().isoformat()
-        }
+        result = _STATUS_TEMPLATE.copy()
+        result["connected_clients"] = len(self.connected_clients)
+        result["timestamp"] = self.current_timestamp()
 
         return self.create_success_response(request_id, result)
 
-    async def handle_client(self, websocket, path):
+    async def _send_loop(self, websocket, send_queue: asyncio.Queue):
+        """Send queued responses in order until a None sentinel is received"""
+        while True:
+            response = await send_queue.get()
+            if response is None:
+                return
+            await websocket.send(response)
+            logger.info("Sent response: %s", response)
+
+    async def handle_client(self, websocket):
         """Handle a client connection"""
         await self.register_client(websocket)
+
+        # Responses are sent from a separate task so writing one reply
+        # overlaps with receiving and processing the next request
+        send_queue = asyncio.Queue()
+        sender = asyncio.create_task(self._send_loop(websocket, send_queue))
         try:
             async for message in websocket:
                 response = await self.handle_message(websocket, message)
                 if response:
-                    await websocket.send(response)
-                    logger.info(f"Sent response: {response}")
+                    send_queue.put_nowait(response)
         except websockets.exceptions.ConnectionClosed:
             logger.info("Client connection closed")
         except Exception as e:
-            logger.error(f"Error in client handler: {e}")
+            logger.error("Error in client handler: %s", e)
         finally:
+            send_queue.put_nowait(None)
+            try:
+                await sender
+            except websockets.exceptions.ConnectionClosed:
+                logger.info("Client connection closed before all responses were sent")
+            except Exception as e:
+                logger.error("Error sending responses: %s", e)
             await self.unregister_client(websocket)
 
     async def start_server(self):
         """Start the WebSocket server"""
-        logger.info(f"Starting MCP test server on {self.host}:{self.port}")
+        logger.info("Starting MCP test server on %s:%s", self.host, self.port)
 
         async with websockets.serve(self.handle_client, self.host, self.port):
-            logger.info(f"MCP test server running on ws://{self.host}:{self.port}")
+            logger.info("MCP test server running on ws://%s:%s", self.host, self.port)
             logger.info("Waiting for connections from Unreal Engine plugin...")
             await asyncio.Future()  # Run forever
 
@@ -250,7 +310,7 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Server stopped by user")
     except Exception as e:
-        logger.error(f"Server error: {e}")
+        logger.error("Server error: %s", e)
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
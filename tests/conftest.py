@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+"""
+Shared pytest configuration for UnrealBlueprintMCP tests
+"""
+
+import os
+import sys
+
+# Make the server modules in the project root importable from every test module
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def pytest_configure(config):
+    """Register the xdist_group marker so it is known even without pytest-xdist"""
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on the same xdist worker"
+    )
\ No newline at end of file
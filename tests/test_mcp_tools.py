@@ -8,65 +8,138 @@ to various input parameters and handle errors appropriately.
 
 import pytest
 import asyncio
+import importlib
 import json
-from unittest.mock import AsyncMock, patch
-import sys
-import os
+from typing import List, Optional
 
-# Add parent directory to path for imports
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from pydantic import BaseModel, ConfigDict
+
+@pytest.fixture(scope="module")
+def srv():
+    """Server module, imported once for all tests in this file"""
+    return importlib.import_module("unreal_blueprint_mcp_server")
+
+# Fixed fields of the mocked Unreal response, built once at import
+_SUCCESS_BASE = {
+    "success": True,
+    "timestamp": "2025-09-17T00:00:00.000Z"
+}
 
 # Mock the send_command_to_unreal function since we're testing without Unreal
 async def mock_send_command_success(method: str, params: dict):
     """Mock successful Unreal command"""
-    return {
-        "success": True,
-        "message": f"Command '{method}' executed successfully",
-        "timestamp": "2025-09-17T00:00:00.000Z",
-        "data": params
-    }
+    return {**_SUCCESS_BASE, "message": f"Command '{method}' executed successfully", "data": params}
 
 async def mock_send_command_failure(method: str, params: dict):
-    """Mock failed Unreal command"""
-    return {
-        "success": False,
-        "message": f"Command '{method}' failed",
-        "error": "Simulated error",
-        "timestamp": "2025-09-17T00:00:00.000Z"
-    }
+    """Mock failed Unreal command; the tools only see failures as raised errors"""
+    raise ConnectionError(f"Command '{method}' failed: Simulated error")
+
+# Expected response shapes, validated in one model_validate() call per result
+# instead of a separate key lookup for every field
+
+class ServerStatus(BaseModel):
+    """Fields checked in get_server_status results"""
+    model_config = ConfigDict(strict=True)
+
+    server_name: str
+    version: str
+    available_tools: List[str]
+
+class BlueprintResult(BaseModel):
+    """Fields checked in create_blueprint results"""
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    blueprint_path: str
+    parent_class: str
+
+class PropertyResult(BaseModel):
+    """Fields checked in set_blueprint_property results"""
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    property_name: str
+    property_value: str
+    property_type: Optional[str]
+
+class ConnectionResult(BaseModel):
+    """Fields checked in test_unreal_connection results"""
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    response_time_seconds: float
+    connection_status: str
+    unreal_response: Optional[dict]
+
+class FailureResult(BaseModel):
+    """Fields checked in failed tool results"""
+    model_config = ConfigDict(strict=True)
+
+    success: bool
+    error: str
+
+# (tool, mocked Unreal reply, params model and fields or None, result model, expected field values)
+BLUEPRINT_TOOL_CASES = [
+    pytest.param(
+        "create_blueprint", mock_send_command_success,
+        ("BlueprintCreateParams", {
+            "blueprint_name": "TestActor",
+            "parent_class": "Actor",
+            "asset_path": "/Game/Blueprints/"
+        }),
+        BlueprintResult,
+        {"success": True, "blueprint_path": "/Game/Blueprints/TestActor", "parent_class": "Actor"},
+        id="create_blueprint_success"
+    ),
+    pytest.param(
+        "create_blueprint", mock_send_command_failure,
+        ("BlueprintCreateParams", {
+            "blueprint_name": "FailActor",
+            "parent_class": "Actor",
+            "asset_path": "/Game/Blueprints/"
+        }),
+        FailureResult,
+        {"success": False},
+        id="create_blueprint_failure"
+    ),
+    pytest.param(
+        "set_blueprint_property", mock_send_command_success,
+        ("BlueprintPropertyParams", {
+            "blueprint_path": "/Game/Blueprints/TestActor",
+            "property_name": "Health",
+            "property_value": "100",
+            "property_type": "int"
+        }),
+        PropertyResult,
+        {"success": True, "property_name": "Health", "property_value": "100", "property_type": "int"},
+        id="set_blueprint_property_success"
+    ),
+    pytest.param(
+        "test_unreal_connection", mock_send_command_success,
+        None,
+        ConnectionResult,
+        {"success": True},
+        id="test_unreal_connection"
+    ),
+]
 
 class TestMCPTools:
     """Test cases for MCP tools"""
 
-    @pytest.fixture(autouse=True)
-    def setup_method(self):
-        """Setup for each test method"""
-        # Import here to avoid import issues
-        global unreal_blueprint_mcp_server
-        import unreal_blueprint_mcp_server
-        self.server_module = unreal_blueprint_mcp_server
-
     @pytest.mark.asyncio
-    async def test_get_server_status(self):
+    async def test_get_server_status(self, srv):
         """Test get_server_status tool"""
-        # Import the actual function implementation from the server module
-        from unreal_blueprint_mcp_server import get_server_status
-
-        status = get_server_status()
+        status = await srv.get_server_status()
 
         assert isinstance(status, dict)
-        assert "server_name" in status
-        assert "version" in status
-        assert "available_tools" in status
-        assert status["server_name"] == "UnrealBlueprintMCPServer"
-        assert len(status["available_tools"]) == 4  # Expected number of tools
+        status = ServerStatus.model_validate(status)
+        assert status.server_name == "UnrealBlueprintMCPServer"
+        assert len(status.available_tools) == 4  # Expected number of tools
 
     @pytest.mark.asyncio
-    async def test_list_supported_blueprint_classes(self):
+    async def test_list_supported_blueprint_classes(self, srv):
         """Test list_supported_blueprint_classes tool"""
-        from unreal_blueprint_mcp_server import list_supported_blueprint_classes
-
-        classes = list_supported_blueprint_classes()
+        classes = await srv.list_supported_blueprint_classes()
 
         assert isinstance(classes, list)
         assert len(classes) == 7  # Expected number of supported classes
@@ -76,119 +149,163 @@ class TestMCPTools:
         assert "UserWidget" in classes
 
     @pytest.mark.asyncio
-    @patch('unreal_blueprint_mcp_server.send_command_to_unreal', side_effect=mock_send_command_success)
-    async def test_create_blueprint_success(self, mock_send):
-        """Test successful blueprint creation"""
-        from unreal_blueprint_mcp_server import create_blueprint, BlueprintCreateParams
+    @pytest.mark.parametrize("tool_name, mock_send, params, result_model, expected", BLUEPRINT_TOOL_CASES)
+    async def test_blueprint_tool(self, srv, monkeypatch, tool_name, mock_send, params, result_model, expected):
+        """Test blueprint tools against mocked Unreal success and failure replies"""
+        monkeypatch.setattr(srv, "send_command_to_unreal", mock_send)
 
-        params = BlueprintCreateParams(
-            blueprint_name="TestActor",
-            parent_class="Actor",
-            asset_path="/Game/Blueprints/"
-        )
+        args = ()
+        if params is not None:
+            params_class, fields = params
+            args = (getattr(srv, params_class)(**fields),)
 
-        result = create_blueprint(params)
+        result = await getattr(srv, tool_name)(*args)
 
         assert isinstance(result, dict)
-        assert result["success"] is True
-        assert "blueprint_path" in result
-        assert result["blueprint_path"] == "/Game/Blueprints/TestActor"
-        assert result["parent_class"] == "Actor"
+        result = result_model.model_validate(result)
+        for field, value in expected.items():
+            assert getattr(result, field) == value
 
     @pytest.mark.asyncio
-    @patch('unreal_blueprint_mcp_server.send_command_to_unreal', side_effect=mock_send_command_failure)
-    async def test_create_blueprint_failure(self, mock_send):
-        """Test blueprint creation failure"""
-        from unreal_blueprint_mcp_server import create_blueprint, BlueprintCreateParams
-
-        params = BlueprintCreateParams(
-            blueprint_name="FailActor",
-            parent_class="Actor",
-            asset_path="/Game/Blueprints/"
-        )
+    async def test_create_test_actor_blueprint(self, srv, monkeypatch):
+        """Test create_test_actor_blueprint tool"""
+        monkeypatch.setattr(srv, "send_command_to_unreal", mock_send_command_success)
 
-        result = create_blueprint(params)
+        location = srv.Vector3D(x=100, y=200, z=300)
+        result = await srv.create_test_actor_blueprint("TestActor", location)
 
         assert isinstance(result, dict)
-        assert result["success"] is False
-        assert "error" in result
+        assert result["success"] is True
+        assert "location" in result
+        assert result["location"]["x"] == 100.0
+        assert result["location"]["y"] == 200.0
+        assert result["location"]["z"] == 300.0
+        assert result["blueprint_creation"]["blueprint_path"] == result["final_blueprint_path"]
+        assert result["property_setting"]["property_value"] == (100.0, 200.0, 300.0)
+
+    @pytest.fixture
+    def outbound(self, srv, monkeypatch):
+        """Queue of a stub Unreal client; frames the real send path writes end up here"""
+        async def server_running():
+            pass
+
+        client = object()
+        queue = asyncio.Queue()
+        monkeypatch.setattr(srv, "ensure_websocket_server", server_running)
+        monkeypatch.setattr(srv, "unreal_client", client)
+        monkeypatch.setitem(srv.client_states, client, srv.ClientState(address="stub", outbound=queue, last_active=0.0))
+        return queue
 
     @pytest.mark.asyncio
-    @patch('unreal_blueprint_mcp_server.send_command_to_unreal', side_effect=mock_send_command_success)
-    async def test_set_blueprint_property_success(self, mock_send):
-        """Test successful blueprint property setting"""
-        from unreal_blueprint_mcp_server import set_blueprint_property, BlueprintPropertyParams
+    async def test_concurrent_commands_matched_by_id(self, srv, outbound):
+        """Replies reach their callers by JSON-RPC id, whatever order they arrive in"""
+        calls = [asyncio.create_task(srv.send_command_to_unreal("ping", {"n": n})) for n in range(5)]
+        frames = [json.loads((await outbound.get())[1]) for _ in calls]
 
-        params = BlueprintPropertyParams(
-            blueprint_path="/Game/Blueprints/TestActor",
-            property_name="Health",
-            property_value="100",
-            property_type="int"
-        )
+        # Answer the commands in reverse order
+        for frame in reversed(frames):
+            srv.pending_responses[frame["id"]].set_result(
+                {"jsonrpc": "2.0", "id": frame["id"], "result": frame["params"]}
+            )
 
-        result = set_blueprint_property(params)
+        assert await asyncio.gather(*calls) == [{"n": n} for n in range(5)]
+        assert not srv.pending_responses
 
-        assert isinstance(result, dict)
-        assert result["success"] is True
-        assert result["property_name"] == "Health"
-        assert result["property_value"] == "100"
-        assert result["property_type"] == "int"
+    @pytest.mark.asyncio
+    async def test_full_outbound_queue_times_out(self, srv, monkeypatch):
+        """A client whose queue stays full times the command out and leaves nothing pending"""
+        async def server_running():
+            pass
+
+        client = object()
+        queue = asyncio.Queue(maxsize=1)
+        queue.put_nowait(("0", b"{}"))
+        monkeypatch.setattr(srv, "ensure_websocket_server", server_running)
+        monkeypatch.setattr(srv, "unreal_client", client)
+        monkeypatch.setitem(srv.client_states, client, srv.ClientState(address="stub", outbound=queue, last_active=0.0))
+
+        with pytest.raises(TimeoutError):
+            await srv.send_command_to_unreal("ping", {}, timeout=0.05)
+        assert not srv.pending_responses
 
     @pytest.mark.asyncio
-    @patch('unreal_blueprint_mcp_server.send_command_to_unreal', side_effect=mock_send_command_success)
-    async def test_create_test_actor_blueprint(self, mock_send):
-        """Test create_test_actor_blueprint tool"""
-        from unreal_blueprint_mcp_server import create_test_actor_blueprint, Vector3D
+    async def test_vector_property_value_sent_as_numbers(self, srv, outbound):
+        """A [x, y, z] property value reaches the wire as a JSON array of numbers"""
+        params = srv.BlueprintPropertyParams(
+            blueprint_path="/Game/Blueprints/TestActor",
+            property_name="RelativeLocation",
+            property_value=[1.0, 2.0, 3.0],
+            property_type="Vector"
+        )
+        call = asyncio.create_task(srv._set_blueprint_property_logic(params))
 
-        location = Vector3D(x=100, y=200, z=300)
-        result = create_test_actor_blueprint("TestActor", location)
+        message_id, payload = await outbound.get()
+        frame = json.loads(payload)
+        assert frame["method"] == "set_property"
+        assert frame["params"]["property_value"] == [1.0, 2.0, 3.0]
 
-        assert isinstance(result, dict)
-        assert result["success"] is True
-        assert "location" in result
-        assert result["location"]["x"] == 100.0
-        assert result["location"]["y"] == 200.0
-        assert result["location"]["z"] == 300.0
+        srv.pending_responses[message_id].set_result({"jsonrpc": "2.0", "id": message_id, "result": {"success": True}})
+        assert (await call)["success"] is True
 
     @pytest.mark.asyncio
-    @patch('unreal_blueprint_mcp_server.send_command_to_unreal', side_effect=mock_send_command_success)
-    async def test_test_unreal_connection(self, mock_send):
-        """Test test_unreal_connection tool"""
-        from unreal_blueprint_mcp_server import test_unreal_connection
-
-        result = test_unreal_connection()
-
-        assert isinstance(result, dict)
-        assert result["success"] is True
-        assert "response_time_seconds" in result
-        assert "connection_status" in result
+    async def test_test_actor_properties_sent_as_object(self, srv, outbound):
+        """create_test_actor_blueprint sends its properties as a JSON object in one frame"""
+        location = srv.Vector3D(x=1, y=2, z=3)
+        call = asyncio.create_task(srv.create_test_actor_blueprint("TestActor", location))
+
+        message_id, payload = await outbound.get()
+        frame = json.loads(payload)
+        assert frame["method"] == "create_blueprint_with_properties"
+        assert frame["params"]["blueprint_name"] == "TestActor"
+        assert frame["params"]["properties"] == {"RootComponent": [1.0, 2.0, 3.0]}
+
+        srv.pending_responses[message_id].set_result({"jsonrpc": "2.0", "id": message_id, "result": {"success": True}})
+        assert (await call)["success"] is True
+        assert outbound.empty()
+
+    def test_broadcast_queues_one_notification_per_client(self, srv, monkeypatch):
+        """broadcast_to_unreal writes through each client's outbound queue, without an id"""
+        queues = [asyncio.Queue() for _ in range(3)]
+        for n, queue in enumerate(queues):
+            monkeypatch.setitem(srv.client_states, object(), srv.ClientState(address=f"stub{n}", outbound=queue, last_active=0.0))
+
+        assert srv.broadcast_to_unreal("editor_event", {"event": "saved"}) == len(queues)
+
+        for queue in queues:
+            assert queue.qsize() == 1
+            message_id, payload = queue.get_nowait()
+            frame = json.loads(payload)
+            assert message_id is None
+            assert "id" not in frame
+            assert frame["method"] == "editor_event"
+            assert frame["params"] == {"event": "saved"}
 
 class TestDataValidation:
     """Test data validation and Pydantic models"""
 
-    def test_vector3d_validation(self):
+    def test_vector3d_validation(self, srv):
         """Test Vector3D model validation"""
-        from unreal_blueprint_mcp_server import Vector3D
-
         # Valid vector
-        vector = Vector3D(x=1.0, y=2.0, z=3.0)
+        vector = srv.Vector3D(x=1.0, y=2.0, z=3.0)
         assert vector.x == 1.0
         assert vector.y == 2.0
         assert vector.z == 3.0
         assert str(vector) == "1.0,2.0,3.0"
 
         # Default values
-        vector_default = Vector3D()
+        vector_default = srv.Vector3D()
         assert vector_default.x == 0.0
         assert vector_default.y == 0.0
         assert vector_default.z == 0.0
 
-    def test_blueprint_create_params_validation(self):
-        """Test BlueprintCreateParams model validation"""
-        from unreal_blueprint_mcp_server import BlueprintCreateParams
+    def test_supported_classes_pass_validation(self, srv):
+        """Every class listed as supported is accepted by the parent class whitelist"""
+        assert set(srv.SUPPORTED_BLUEPRINT_CLASSES) <= srv.SecurityValidator.VALID_PARENT_CLASSES
 
+    def test_blueprint_create_params_validation(self, srv):
+        """Test BlueprintCreateParams model validation"""
         # Valid params
-        params = BlueprintCreateParams(
+        params = srv.BlueprintCreateParams(
             blueprint_name="TestActor",
             parent_class="Actor",
             asset_path="/Game/Blueprints/"
@@ -198,17 +315,15 @@ class TestDataValidation:
         assert params.asset_path == "/Game/Blueprints/"
 
         # Default values
-        params_minimal = BlueprintCreateParams(blueprint_name="MinimalActor")
+        params_minimal = srv.BlueprintCreateParams(blueprint_name="MinimalActor")
         assert params_minimal.blueprint_name == "MinimalActor"
         assert params_minimal.parent_class == "Actor"  # Default
         assert params_minimal.asset_path == "/Game/Blueprints/"  # Default
 
-    def test_blueprint_property_params_validation(self):
+    def test_blueprint_property_params_validation(self, srv):
         """Test BlueprintPropertyParams model validation"""
-        from unreal_blueprint_mcp_server import BlueprintPropertyParams
-
         # Valid params with type
-        params = BlueprintPropertyParams(
+        params = srv.BlueprintPropertyParams(
             blueprint_path="/Game/Blueprints/TestActor",
             property_name="Health",
             property_value="100",
@@ -220,44 +335,49 @@ class TestDataValidation:
         assert params.property_type == "int"
 
         # Valid params without type
-        params_no_type = BlueprintPropertyParams(
+        params_no_type = srv.BlueprintPropertyParams(
             blueprint_path="/Game/Blueprints/TestActor",
             property_name="Name",
             property_value="TestName"
         )
         assert params_no_type.property_type is None
 
+    @pytest.mark.parametrize("value", [[1.0], [1.0, 2.0], [1.0, 2.0, 3.0, 4.0]])
+    def test_vector_property_value_needs_three_numbers(self, srv, value):
+        """Vector property values other than [x, y, z] are rejected before reaching Unreal"""
+        with pytest.raises(ValueError):
+            srv.BlueprintPropertyParams(
+                blueprint_path="/Game/Blueprints/TestActor",
+                property_name="RelativeLocation",
+                property_value=value,
+                property_type="Vector"
+            )
+
 class TestErrorHandling:
     """Test error handling scenarios"""
 
     @pytest.mark.asyncio
-    async def test_invalid_blueprint_name(self):
+    async def test_invalid_blueprint_name(self, srv):
         """Test handling of invalid blueprint names"""
-        from unreal_blueprint_mcp_server import BlueprintCreateParams
-
         # Test empty name - should raise validation error
         with pytest.raises(Exception):  # Pydantic validation error
-            BlueprintCreateParams(blueprint_name="")
+            srv.BlueprintCreateParams(blueprint_name="")
 
     @pytest.mark.asyncio
-    async def test_invalid_parent_class(self):
+    async def test_invalid_parent_class(self, srv):
         """Test handling of invalid parent classes"""
-        from unreal_blueprint_mcp_server import BlueprintCreateParams
-
         # This should be valid at Pydantic level but caught at execution level
-        params = BlueprintCreateParams(
+        params = srv.BlueprintCreateParams(
             blueprint_name="TestActor",
             parent_class="InvalidClass"
         )
         assert params.parent_class == "InvalidClass"
 
     @pytest.mark.asyncio
-    async def test_invalid_asset_path(self):
+    async def test_invalid_asset_path(self, srv):
         """Test handling of invalid asset paths"""
-        from unreal_blueprint_mcp_server import BlueprintCreateParams
-
         # This should be valid at Pydantic level but caught at execution level
-        params = BlueprintCreateParams(
+        params = srv.BlueprintCreateParams(
             blueprint_name="TestActor",
             asset_path="/Invalid/Path/"
         )
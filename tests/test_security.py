@@ -16,158 +16,175 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).parent.parent))
 
 from security_utils import (
-    SecurityValidator, SecurityError,
+    SecurityValidator, SecurityError, ErrorCode,
     validate_blueprint_creation_params,
     validate_property_setting_params
 )
 from unreal_blueprint_mcp_server import BlueprintCreateParams, BlueprintPropertyParams
 
+# One character over the default 1MB WebSocket message limit, allocated once
+OVERSIZED_MESSAGE = "x" * (1024 * 1024 + 1)
+
 
 class TestSecurityValidator:
     """Test cases for SecurityValidator class"""
 
-    def test_valid_blueprint_name(self):
+    @pytest.mark.parametrize("name", ["MyActor", "TestCharacter", "Player_Controller", "UI_Widget123"])
+    def test_valid_blueprint_name(self, name):
         """Test valid blueprint names"""
-        valid_names = ["MyActor", "TestCharacter", "Player_Controller", "UI_Widget123"]
-
-        for name in valid_names:
-            result = SecurityValidator.validate_blueprint_name(name)
-            assert result["valid"], f"'{name}' should be valid: {result['errors']}"
-
-    def test_invalid_blueprint_name(self):
+        result = SecurityValidator.validate_blueprint_name(name)
+        assert result["valid"], f"'{name}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("name", [
+        "",  # Empty name
+        "123Actor",  # Starts with number
+        "My-Actor",  # Contains hyphen
+        "My Actor",  # Contains space
+        "Actor<Script>",  # Contains dangerous characters
+        "class",  # Reserved keyword
+        "a" * 65,  # Too long
+    ])
+    def test_invalid_blueprint_name(self, name):
         """Test invalid blueprint names"""
-        invalid_names = [
-            "",  # Empty name
-            "123Actor",  # Starts with number
-            "My-Actor",  # Contains hyphen
-            "My Actor",  # Contains space
-            "Actor<Script>",  # Contains dangerous characters
-            "class",  # Reserved keyword
-            "a" * 65,  # Too long
-        ]
-
-        for name in invalid_names:
-            result = SecurityValidator.validate_blueprint_name(name)
-            assert not result["valid"], f"'{name}' should be invalid but was accepted"
-
-    def test_valid_property_name(self):
-        """Test valid property names"""
-        valid_names = ["Health", "MaxSpeed", "Player_Name", "item_count"]
-
-        for name in valid_names:
-            result = SecurityValidator.validate_property_name(name)
-            assert result["valid"], f"'{name}' should be valid: {result['errors']}"
+        result = SecurityValidator.validate_blueprint_name(name)
+        assert not result["valid"], f"'{name}' should be invalid but was accepted"
 
-    def test_invalid_property_name(self):
+    @pytest.mark.parametrize("name", ["Health", "MaxSpeed", "Player_Name", "item_count"])
+    def test_valid_property_name(self, name):
+        """Test valid property names"""
+        result = SecurityValidator.validate_property_name(name)
+        assert result["valid"], f"'{name}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("name", [
+        "",  # Empty name
+        "123health",  # Starts with number
+        "health-value",  # Contains hyphen
+        "health value",  # Contains space
+        "a" * 65,  # Too long
+    ])
+    def test_invalid_property_name(self, name):
         """Test invalid property names"""
-        invalid_names = [
-            "",  # Empty name
-            "123health",  # Starts with number
-            "health-value",  # Contains hyphen
-            "health value",  # Contains space
-            "a" * 65,  # Too long
-        ]
-
-        for name in invalid_names:
-            result = SecurityValidator.validate_property_name(name)
-            assert not result["valid"], f"'{name}' should be invalid but was accepted"
-
-    def test_valid_property_value(self):
+        result = SecurityValidator.validate_property_name(name)
+        assert not result["valid"], f"'{name}' should be invalid but was accepted"
+
+    @pytest.mark.parametrize("value", [
+        "100",
+        "Hello World",
+        "true",
+        "Vector(1,2,3)",
+        [100.0, 200.0, 300.0],
+        None
+    ])
+    def test_valid_property_value(self, value):
         """Test valid property values"""
-        valid_values = [
-            "100",
-            "Hello World",
-            "true",
-            "Vector(1,2,3)",
-            None
-        ]
-
-        for value in valid_values:
-            result = SecurityValidator.validate_property_value(value)
-            assert result["valid"], f"'{value}' should be valid: {result['errors']}"
-
-    def test_xss_prevention_in_property_value(self):
+        result = SecurityValidator.validate_property_value(value)
+        assert result["valid"], f"'{value}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("value,expected", [
+        (100, "100"),
+        (1.5, "1.5"),
+        (True, "True")
+    ])
+    def test_scalar_property_value_sanitized_as_string(self, value, expected):
+        """Numbers and bools are returned as strings, the form the plugin reads"""
+        result = SecurityValidator.validate_property_value(value)
+        assert result["valid"]
+        assert result["sanitized_value"] == expected
+
+    @pytest.mark.parametrize("value", [
+        [],
+        [1.0],
+        [1.0, 2.0],
+        [1.0, 2.0, 3.0, 4.0],
+        [1.0, "2", 3.0],
+    ])
+    def test_invalid_vector_property_value(self, value):
+        """Vector values must be exactly three numbers"""
+        result = SecurityValidator.validate_property_value(value)
+        assert not result["valid"]
+        assert ErrorCode.INVALID_FORMAT in result["error_codes"]
+
+    @pytest.mark.parametrize("xss", [
+        "<script>alert('xss')</script>",
+        "javascript:alert('xss')",
+        "<img src=x onerror=alert('xss')>",
+        "eval('malicious code')",
+        "<iframe src='https://evil.example'></iframe>",
+    ])
+    def test_xss_prevention_in_property_value(self, xss):
         """Test XSS prevention in property values"""
-        xss_attempts = [
-            "<script>alert('xss')</script>",
-            "javascript:alert('xss')",
-            "<img src=x onerror=alert('xss')>",
-            "eval('malicious code')",
-        ]
-
-        for xss in xss_attempts:
-            result = SecurityValidator.validate_property_value(xss)
-            # Should either be invalid or sanitized
-            if result["valid"]:
-                # If valid, must be sanitized (HTML escaped)
-                assert "&lt;" in result["sanitized_value"] or "javascript:" not in result["sanitized_value"]
-            else:
-                # If invalid, should have appropriate error
-                assert any("dangerous" in error.lower() for error in result["errors"])
-
-    def test_valid_asset_path(self):
+        result = SecurityValidator.validate_property_value(xss)
+        # Should either be invalid or sanitized
+        if result["valid"]:
+            # If valid, must be sanitized (HTML escaped)
+            assert "&lt;" in result["sanitized_value"] or "javascript:" not in result["sanitized_value"]
+        else:
+            # If invalid, should have appropriate error
+            assert ErrorCode.DANGEROUS_CONTENT in result["error_codes"]
+
+    @pytest.mark.parametrize("value", [
+        "<iframe src='https://evil.example'></iframe>",
+        "<IFRAME>",
+    ])
+    def test_iframe_property_value_rejected(self, value):
+        """Embedded frames are rejected outright rather than escaped"""
+        result = SecurityValidator.validate_property_value(value)
+        assert not result["valid"]
+        assert ErrorCode.DANGEROUS_CONTENT in result["error_codes"]
+
+    @pytest.mark.parametrize("path", [
+        "/Game/Blueprints/",
+        "/Game/Characters/",
+        "/Game/UI/Widgets/",
+        "/Game/Items/Weapons/"
+    ])
+    def test_valid_asset_path(self, path):
         """Test valid asset paths"""
-        valid_paths = [
-            "/Game/Blueprints/",
-            "/Game/Characters/",
-            "/Game/UI/Widgets/",
-            "/Game/Items/Weapons/"
-        ]
-
-        for path in valid_paths:
-            result = SecurityValidator.validate_asset_path(path)
-            assert result["valid"], f"'{path}' should be valid: {result['errors']}"
-
-    def test_path_traversal_prevention(self):
+        result = SecurityValidator.validate_asset_path(path)
+        assert result["valid"], f"'{path}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("path", [
+        "/Game/../../../etc/passwd",
+        "/Game/Blueprints/../../../secret",
+        "/Game/Blueprints/../../..",
+        "../Game/Blueprints/",
+        "/Game/./../../etc/",
+    ])
+    def test_path_traversal_prevention(self, path):
         """Test path traversal attack prevention"""
-        malicious_paths = [
-            "/Game/../../../etc/passwd",
-            "/Game/Blueprints/../../../secret",
-            "/Game/Blueprints/../../..",
-            "../Game/Blueprints/",
-            "/Game/./../../etc/",
-        ]
-
-        for path in malicious_paths:
-            result = SecurityValidator.validate_asset_path(path)
-            assert not result["valid"], f"'{path}' should be blocked as potential path traversal"
-
-    def test_invalid_asset_path(self):
+        result = SecurityValidator.validate_asset_path(path)
+        assert not result["valid"], f"'{path}' should be blocked as potential path traversal"
+
+    @pytest.mark.parametrize("path", [
+        "",  # Empty
+        "/InvalidRoot/",  # Doesn't start with /Game/
+        "/Game/Path<script>",  # Dangerous characters
+        "/Game/Path|pipe",  # Pipe character
+        "/Game/Path?query",  # Query character
+        "a" * 300,  # Too long
+    ])
+    def test_invalid_asset_path(self, path):
         """Test invalid asset paths"""
-        invalid_paths = [
-            "",  # Empty
-            "/InvalidRoot/",  # Doesn't start with /Game/
-            "/Game/Path<script>",  # Dangerous characters
-            "/Game/Path|pipe",  # Pipe character
-            "/Game/Path?query",  # Query character
-            "a" * 300,  # Too long
-        ]
-
-        for path in invalid_paths:
-            result = SecurityValidator.validate_asset_path(path)
-            assert not result["valid"], f"'{path}' should be invalid but was accepted"
-
-    def test_valid_parent_class(self):
-        """Test valid parent classes"""
-        valid_classes = ["Actor", "Pawn", "Character", "UserWidget", "ActorComponent"]
+        result = SecurityValidator.validate_asset_path(path)
+        assert not result["valid"], f"'{path}' should be invalid but was accepted"
 
-        for cls in valid_classes:
-            result = SecurityValidator.validate_parent_class(cls)
-            assert result["valid"], f"'{cls}' should be valid: {result['errors']}"
-
-    def test_invalid_parent_class(self):
+    @pytest.mark.parametrize("cls", ["Actor", "Pawn", "Character", "UserWidget", "ActorComponent"])
+    def test_valid_parent_class(self, cls):
+        """Test valid parent classes"""
+        result = SecurityValidator.validate_parent_class(cls)
+        assert result["valid"], f"'{cls}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("cls", [
+        "",  # Empty
+        "CustomClass",  # Not in whitelist
+        "Script",  # Dangerous
+        "<script>",  # XSS attempt
+        "System.Object",  # System class
+    ])
+    def test_invalid_parent_class(self, cls):
         """Test invalid parent classes"""
-        invalid_classes = [
-            "",  # Empty
-            "CustomClass",  # Not in whitelist
-            "Script",  # Dangerous
-            "<script>",  # XSS attempt
-            "System.Object",  # System class
-        ]
-
-        for cls in invalid_classes:
-            result = SecurityValidator.validate_parent_class(cls)
-            assert not result["valid"], f"'{cls}' should be invalid but was accepted"
+        result = SecurityValidator.validate_parent_class(cls)
+        assert not result["valid"], f"'{cls}' should be invalid but was accepted"
 
     def test_json_rpc_sanitization(self):
         """Test JSON-RPC parameter sanitization"""
@@ -179,6 +196,8 @@ class TestSecurityValidator:
             "number_value": 123,
             "boolean_value": True,
             "null_value": None,
+            "vector_value": [1.0, 2.0, 3.0],
+            "nested": {"RootComponent": [1.0, 2.0, 3.0], "label": "<b>x</b>", "bad key": 1},
         }
 
         sanitized = SecurityValidator.sanitize_json_rpc_params(dangerous_params)
@@ -188,6 +207,8 @@ class TestSecurityValidator:
         assert sanitized["number_value"] == 123
         assert sanitized["boolean_value"] is True
         assert sanitized["null_value"] is None
+        assert sanitized["vector_value"] == [1.0, 2.0, 3.0]
+        assert sanitized["nested"] == {"RootComponent": [1.0, 2.0, 3.0], "label": "&lt;b&gt;x&lt;/b&gt;"}
 
         # Dangerous content should be escaped
         assert "&lt;script&gt;" in sanitized["xss_attempt"]
@@ -200,37 +221,61 @@ class TestSecurityValidator:
         assert SecurityValidator.validate_websocket_message_size(normal_message)
 
         # Oversized message should fail
-        oversized_message = "x" * (1024 * 1024 + 1)  # > 1MB
-        assert not SecurityValidator.validate_websocket_message_size(oversized_message)
+        assert not SecurityValidator.validate_websocket_message_size(OVERSIZED_MESSAGE)
 
         # Custom size limit
         medium_message = "x" * 1000
         assert SecurityValidator.validate_websocket_message_size(medium_message, max_size=500) is False
         assert SecurityValidator.validate_websocket_message_size(medium_message, max_size=2000) is True
 
-    def test_url_validation(self):
-        """Test URL validation for WebSocket connections"""
-        valid_urls = [
-            "ws://localhost:8080",
-            "wss://secure.example.com:443",
-            "ws://127.0.0.1:6277"
-        ]
-
-        for url in valid_urls:
-            result = SecurityValidator.validate_url(url)
-            assert result["valid"], f"'{url}' should be valid: {result['errors']}"
-
-        invalid_urls = [
-            "",  # Empty
-            "http://example.com",  # Wrong protocol
-            "ftp://example.com",  # Wrong protocol
-            "ws://",  # No hostname
-            "invalid-url",  # Invalid format
-        ]
-
-        for url in invalid_urls:
-            result = SecurityValidator.validate_url(url)
-            assert not result["valid"], f"'{url}' should be invalid but was accepted"
+    @pytest.mark.parametrize("url", [
+        "ws://localhost:8080",
+        "wss://secure.example.com:443",
+        "ws://127.0.0.1:6277"
+    ])
+    def test_valid_url(self, url):
+        """Test valid URLs for WebSocket connections"""
+        result = SecurityValidator.validate_url(url)
+        assert result["valid"], f"'{url}' should be valid: {result['errors']}"
+
+    @pytest.mark.parametrize("url", [
+        "",  # Empty
+        "http://example.com",  # Wrong protocol
+        "ftp://example.com",  # Wrong protocol
+        "ws://",  # No hostname
+        "invalid-url",  # Invalid format
+    ])
+    def test_invalid_url(self, url):
+        """Test invalid URLs for WebSocket connections"""
+        result = SecurityValidator.validate_url(url)
+        assert not result["valid"], f"'{url}' should be invalid but was accepted"
+
+    def test_validate_creation_batch(self):
+        """Test combined validation of blueprint creation parameters"""
+        result = SecurityValidator.validate_creation_batch("TestActor", "Actor", "/Game/Blueprints")
+        assert result["valid"]
+        assert result["normalized_path"] == "/Game/Blueprints/"
+
+        # A reserved name must not slip through the combined pattern
+        result = SecurityValidator.validate_creation_batch("Class", "Actor", "/Game/Blueprints/")
+        assert not result["valid"]
+        assert result["error_codes"] == {ErrorCode.RESERVED_KEYWORD}
+
+        result = SecurityValidator.validate_creation_batch("TestActor", "actor", "/Game/../Secret/")
+        assert not result["valid"]
+        assert result["error_codes"] == {ErrorCode.INVALID_PARENT_CLASS, ErrorCode.PATH_TRAVERSAL}
+        assert len(result["errors"]) == 2
+
+    def test_validation_results_are_cached(self):
+        """Test repeated string inputs reuse the cached result"""
+        first = SecurityValidator.validate_asset_path("/Game/Blueprints/")
+        second = SecurityValidator.validate_asset_path("/Game/Blueprints/")
+        assert first is second
+        assert second["normalized_path"] == "/Game/Blueprints/"
+
+        # Unhashable input bypasses the cache instead of raising
+        result = SecurityValidator.validate_blueprint_name(["MyActor"])
+        assert not result["valid"]
 
 
 class TestPydanticValidation:
@@ -6,11 +6,81 @@ Tests the WebSocket communication layer between MCP server and clients.
 """
 
 import pytest
+import pytest_asyncio
 import asyncio
 import websockets
+from websockets.protocol import State
 import json
 import time
-from unittest.mock import patch, AsyncMock
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Use orjson for request/response payloads when available. Requests are
+# still sent as text frames, matching what the Unreal plugin sends
+if orjson is not None:
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+
+    _loads = orjson.loads
+else:
+    _dumps = json.dumps
+    _loads = json.loads
+
+# MCP server every test in this module talks to
+SERVER_URL = "ws://localhost:6277"
+
+# Every test here talks to the one server on port 6277, so keep them on a
+# single worker when running under pytest-xdist with --dist loadgroup
+pytestmark = pytest.mark.xdist_group("integration")
+
+# Connection options for small JSON-RPC exchanges: no per-message deflate,
+# no background keepalive pings and a frame limit sized for these payloads
+WS_CONNECT_OPTIONS = {
+    "open_timeout": 5,
+    "compression": None,
+    "max_size": 64 * 1024,
+    "ping_interval": None,
+    "ping_timeout": None,
+}
+
+
+def _status_call_frames(id_prefix, count):
+    """Serialise get_server_status calls once, each with its own request id"""
+    return [
+        _dumps({
+            "jsonrpc": "2.0",
+            "id": f"{id_prefix}_{call_id}",
+            "method": "tools/call",
+            "params": {
+                "name": "get_server_status",
+                "arguments": {}
+            }
+        })
+        for call_id in range(count)
+    ]
+
+
+# Request frames for the performance tests, built at import so the timed
+# loops measure the round trip rather than client-side encoding
+LATENCY_MESSAGES = 5
+LATENCY_FRAMES = _status_call_frames("latency_test", LATENCY_MESSAGES)
+THROUGHPUT_MESSAGES = 10
+THROUGHPUT_FRAMES = _status_call_frames("throughput_test", THROUGHPUT_MESSAGES)
+THROUGHPUT_IDS = frozenset(f"throughput_test_{i}" for i in range(THROUGHPUT_MESSAGES))
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def shared_ws():
+    """Single WebSocket connection reused by tests that do not exercise the connection lifecycle"""
+    try:
+        websocket = await websockets.connect(SERVER_URL, **WS_CONNECT_OPTIONS)
+    except (ConnectionRefusedError, OSError):
+        pytest.skip("MCP server not running - WebSocket test skipped")
+
+    yield websocket
+    await websocket.close()
 
 class TestWebSocketCommunication:
     """Test WebSocket communication functionality"""
@@ -18,63 +88,52 @@ class TestWebSocketCommunication:
     @pytest.fixture
     def server_url(self):
         """WebSocket server URL for testing"""
-        return "ws://localhost:6277"
+        return SERVER_URL
 
     @pytest.mark.asyncio
     async def test_basic_websocket_connection(self, server_url):
         """Test basic WebSocket connection establishment"""
         try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
-                assert websocket.open
-                assert websocket.state == websockets.protocol.State.OPEN
+            async with websockets.connect(server_url, **WS_CONNECT_OPTIONS) as websocket:
+                assert websocket.state is State.OPEN
 
         except (ConnectionRefusedError, OSError):
             pytest.skip("MCP server not running - WebSocket test skipped")
 
-    @pytest.mark.asyncio
-    async def test_websocket_ping_pong(self, server_url):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_websocket_ping_pong(self, shared_ws):
         """Test WebSocket ping/pong mechanism"""
-        try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
-                # Send ping
-                pong_waiter = await websocket.ping()
+        # Send ping
+        pong_waiter = await shared_ws.ping()
 
-                # Wait for pong with timeout
-                await asyncio.wait_for(pong_waiter, timeout=5)
+        # Wait for pong with timeout
+        await asyncio.wait_for(pong_waiter, timeout=5)
 
-        except (ConnectionRefusedError, OSError):
-            pytest.skip("MCP server not running - WebSocket ping test skipped")
-
-    @pytest.mark.asyncio
-    async def test_json_message_sending(self, server_url):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_json_message_sending(self, shared_ws):
         """Test sending and receiving JSON messages"""
-        try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
-                # Send JSON message
-                test_message = {
-                    "jsonrpc": "2.0",
-                    "id": "test_json_message",
-                    "method": "tools/list"
-                }
-
-                await websocket.send(json.dumps(test_message))
+        # Send JSON message
+        test_message = {
+            "jsonrpc": "2.0",
+            "id": "test_json_message",
+            "method": "tools/list"
+        }
 
-                # Receive response
-                response = await asyncio.wait_for(websocket.recv(), timeout=5)
-                parsed_response = json.loads(response)
+        await shared_ws.send(_dumps(test_message))
 
-                assert "jsonrpc" in parsed_response
-                assert parsed_response.get("id") == "test_json_message"
+        # Receive response
+        response = await asyncio.wait_for(shared_ws.recv(), timeout=5)
+        parsed_response = _loads(response)
 
-        except (ConnectionRefusedError, OSError):
-            pytest.skip("MCP server not running - JSON message test skipped")
+        assert "jsonrpc" in parsed_response
+        assert parsed_response.get("id") == "test_json_message"
 
     @pytest.mark.asyncio
     async def test_multiple_concurrent_connections(self, server_url):
         """Test handling multiple concurrent WebSocket connections"""
         try:
             async def create_connection(connection_id):
-                async with websockets.connect(server_url, timeout=5) as websocket:
+                async with websockets.connect(server_url, **WS_CONNECT_OPTIONS) as websocket:
                     # Send a message to verify connection works
                     message = {
                         "jsonrpc": "2.0",
@@ -82,10 +141,10 @@ class TestWebSocketCommunication:
                         "method": "tools/list"
                     }
 
-                    await websocket.send(json.dumps(message))
+                    await websocket.send(_dumps(message))
                     response = await asyncio.wait_for(websocket.recv(), timeout=5)
 
-                    return json.loads(response)
+                    return _loads(response)
 
             # Create multiple concurrent connections
             tasks = [create_connection(i) for i in range(3)]
@@ -102,7 +161,7 @@ class TestWebSocketCommunication:
     async def test_large_message_handling(self, server_url):
         """Test handling of large JSON messages"""
         try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
+            async with websockets.connect(server_url, **WS_CONNECT_OPTIONS) as websocket:
                 # Create a large message
                 large_params = {
                     "blueprint_name": "LargeTestActor",
@@ -121,10 +180,10 @@ class TestWebSocketCommunication:
                     }
                 }
 
-                await websocket.send(json.dumps(large_message))
+                await websocket.send(_dumps(large_message))
                 response = await asyncio.wait_for(websocket.recv(), timeout=10)
 
-                parsed_response = json.loads(response)
+                parsed_response = _loads(response)
                 assert parsed_response.get("id") == "large_message_test"
 
         except (ConnectionRefusedError, OSError):
@@ -135,13 +194,13 @@ class TestWebSocketErrorHandling:
 
     @pytest.fixture
     def server_url(self):
-        return "ws://localhost:6277"
+        return SERVER_URL
 
     @pytest.mark.asyncio
     async def test_invalid_json_handling(self, server_url):
         """Test server handling of invalid JSON"""
         try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
+            async with websockets.connect(server_url, **WS_CONNECT_OPTIONS) as websocket:
                 # Send invalid JSON
                 invalid_json = '{"invalid": json without closing brace'
 
@@ -152,7 +211,7 @@ class TestWebSocketErrorHandling:
                     response = await asyncio.wait_for(websocket.recv(), timeout=5)
                     # If we get a response, check if it's an error
                     if response:
-                        parsed = json.loads(response)
+                        parsed = _loads(response)
                         # Should contain error information
                         assert "error" in parsed or "jsonrpc" in parsed
                 except (asyncio.TimeoutError, websockets.exceptions.ConnectionClosed, json.JSONDecodeError):
@@ -167,14 +226,14 @@ class TestWebSocketErrorHandling:
         """Test connection timeout scenarios"""
         # Try to connect to non-existent server
         with pytest.raises((ConnectionRefusedError, OSError, asyncio.TimeoutError)):
-            async with websockets.connect("ws://localhost:9999", timeout=2) as websocket:
+            async with websockets.connect("ws://localhost:9999", **dict(WS_CONNECT_OPTIONS, open_timeout=2)) as websocket:
                 pass
 
     @pytest.mark.asyncio
     async def test_unexpected_connection_close(self, server_url):
         """Test handling of unexpected connection closure"""
         try:
-            websocket = await websockets.connect(server_url, timeout=5)
+            websocket = await websockets.connect(server_url, **WS_CONNECT_OPTIONS)
 
             # Send a message
             message = {
@@ -183,13 +242,13 @@ class TestWebSocketErrorHandling:
                 "method": "tools/list"
             }
 
-            await websocket.send(json.dumps(message))
+            await websocket.send(_dumps(message))
 
             # Forcefully close the connection
             await websocket.close()
 
             # Verify connection is closed
-            assert websocket.closed
+            assert websocket.state is State.CLOSED
 
         except (ConnectionRefusedError, OSError):
             pytest.skip("MCP server not running - connection close test skipped")
@@ -197,104 +256,61 @@ class TestWebSocketErrorHandling:
 class TestWebSocketPerformance:
     """Test WebSocket performance characteristics"""
 
-    @pytest.fixture
-    def server_url(self):
-        return "ws://localhost:6277"
-
-    @pytest.mark.asyncio
-    async def test_message_latency(self, server_url):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_message_latency(self, shared_ws):
         """Test message round-trip latency"""
-        try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
-                latencies = []
+        latencies = []
 
-                for i in range(5):
-                    start_time = time.time()
+        for i, frame in enumerate(LATENCY_FRAMES):
+            start_time = time.time()
 
-                    message = {
-                        "jsonrpc": "2.0",
-                        "id": f"latency_test_{i}",
-                        "method": "tools/call",
-                        "params": {
-                            "name": "get_server_status",
-                            "arguments": {}
-                        }
-                    }
-
-                    await websocket.send(json.dumps(message))
-                    response = await asyncio.wait_for(websocket.recv(), timeout=5)
+            await shared_ws.send(frame)
+            response = await asyncio.wait_for(shared_ws.recv(), timeout=5)
 
-                    end_time = time.time()
-                    latency = end_time - start_time
-                    latencies.append(latency)
+            end_time = time.time()
+            latency = end_time - start_time
+            latencies.append(latency)
 
-                    # Verify we got the right response
-                    parsed = json.loads(response)
-                    assert parsed.get("id") == f"latency_test_{i}"
+            # Verify we got the right response
+            parsed = _loads(response)
+            assert parsed.get("id") == f"latency_test_{i}"
 
-                # Check average latency is reasonable
-                avg_latency = sum(latencies) / len(latencies)
-                assert avg_latency < 1.0  # Should be less than 1 second
+        # Check average latency is reasonable
+        avg_latency = sum(latencies) / len(latencies)
+        assert avg_latency < 1.0  # Should be less than 1 second
 
-                # Check maximum latency
-                max_latency = max(latencies)
-                assert max_latency < 2.0  # Should be less than 2 seconds
+        # Check maximum latency
+        max_latency = max(latencies)
+        assert max_latency < 2.0  # Should be less than 2 seconds
 
-        except (ConnectionRefusedError, OSError):
-            pytest.skip("MCP server not running - latency test skipped")
-
-    @pytest.mark.asyncio
-    async def test_throughput(self, server_url):
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_throughput(self, shared_ws):
         """Test message throughput"""
-        try:
-            async with websockets.connect(server_url, timeout=5) as websocket:
-                num_messages = 10
-                start_time = time.time()
+        num_messages = THROUGHPUT_MESSAGES
+        start_time = time.time()
 
-                # Send multiple messages rapidly
-                tasks = []
-                for i in range(num_messages):
-                    message = {
-                        "jsonrpc": "2.0",
-                        "id": f"throughput_test_{i}",
-                        "method": "tools/call",
-                        "params": {
-                            "name": "get_server_status",
-                            "arguments": {}
-                        }
-                    }
-
-                    send_task = websocket.send(json.dumps(message))
-                    tasks.append(send_task)
+        responses = [None] * num_messages
 
-                # Wait for all sends to complete
-                await asyncio.gather(*tasks)
+        async def drain():
+            for i in range(num_messages):
+                responses[i] = _loads(await asyncio.wait_for(shared_ws.recv(), timeout=5))
 
-                # Receive all responses
-                responses = []
-                for i in range(num_messages):
-                    response = await asyncio.wait_for(websocket.recv(), timeout=5)
-                    responses.append(json.loads(response))
-
-                end_time = time.time()
-                total_time = end_time - start_time
+        # Receive responses while the requests are still being sent
+        recv_task = asyncio.create_task(drain())
+        await asyncio.gather(*(shared_ws.send(frame) for frame in THROUGHPUT_FRAMES), recv_task)
 
-                # Calculate messages per second
-                throughput = num_messages / total_time
+        end_time = time.time()
+        total_time = end_time - start_time
 
-                # Verify all responses received
-                assert len(responses) == num_messages
+        # Calculate messages per second
+        throughput = num_messages / total_time
 
-                # Verify response IDs match
-                response_ids = {r.get("id") for r in responses}
-                expected_ids = {f"throughput_test_{i}" for i in range(num_messages)}
-                assert response_ids == expected_ids
+        # Verify all responses received and their IDs match
+        assert None not in responses
+        assert frozenset(r.get("id") for r in responses) == THROUGHPUT_IDS
 
-                # Basic throughput check (should handle at least 5 messages/second)
-                assert throughput >= 5.0
-
-        except (ConnectionRefusedError, OSError):
-            pytest.skip("MCP server not running - throughput test skipped")
+        # Basic throughput check (should handle at least 5 messages/second)
+        assert throughput >= 5.0
 
 if __name__ == "__main__":
     # Run WebSocket tests
@@ -11,18 +11,40 @@ translating MCP tool calls into JSON-RPC 2.0 messages for the Unreal plugin.
 
 import json
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import asyncio
+import errno
 import websockets
 from websockets.asyncio.server import serve, Server
 from websockets.asyncio.connection import Connection
 import weakref
 import gc
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Set, Union
-from pydantic import BaseModel, Field, field_validator
-import uuid
-import traceback
-import html
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+import itertools
+import time
+import functools
+from collections import OrderedDict
+from dataclasses import dataclass
+import psutil
+
+try:
+    import uvloop
+except ImportError:  # Optional; not available on Windows
+    uvloop = None
+
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the standard json module
+    orjson = None
+
+# A deadline on the current task instead of a wait_for() wrapper per command
+try:
+    from asyncio import timeout as async_timeout
+except ImportError:  # Python < 3.11
+    from async_timeout import timeout as async_timeout
 
 # Import memory management
 from memory_manager import (
@@ -37,21 +59,64 @@ from security_utils import (
 )
 
 # Configure logging
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+logging.basicConfig(level=logging.INFO, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+def _start_log_listener() -> QueueListener:
+    """
+    Route root logging through a queue to a listener thread writing stderr
+
+    Records are still formatted where they are logged, so a slow console never
+    blocks the event loop. Called by the standalone entry point rather than at
+    import, so importing the module starts no threads. Stop the returned
+    listener at shutdown to flush queued records.
+    """
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, logging.StreamHandler())
+    listener.start()
+    return listener
+
+# Compact UTF-8 JSON encoding for frames exchanged with Unreal. The bytes are
+# sent as text frames as-is, because the plugin only handles text frames;
+# orjson.JSONDecodeError subclasses json.JSONDecodeError
+if orjson is not None:
+    _json_dumps = orjson.dumps
+    _json_loads = orjson.loads
+else:
+    # Built once; like orjson, non-ASCII text is written as UTF-8, not escaped
+    _json_encode = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+    def _json_dumps(obj: Any) -> bytes:
+        return _json_encode(obj).encode()
+
+    _json_loads = json.loads
+
 # Pydantic models for structured data validation
 class Vector3D(BaseModel):
     """3D Vector representation"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     x: float = Field(default=0.0, description="X-axis coordinate")
     y: float = Field(default=0.0, description="Y-axis coordinate")
     z: float = Field(default=0.0, description="Z-axis coordinate")
 
     def __str__(self) -> str:
-        return f"{self.x},{self.y},{self.z}"
+        # %r of a float matches str() and formats all three in one C-level call
+        return "%r,%r,%r" % (self.x, self.y, self.z)
 
 class BlueprintCreateParams(BaseModel):
     """Parameters for creating a blueprint with security validation"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     blueprint_name: str = Field(description="Name of the blueprint to create (e.g., 'MyTestActor')")
     parent_class: str = Field(default="Actor", description="Parent class for the blueprint (Actor, Pawn, Character, UserWidget, etc.)")
     asset_path: str = Field(default="/Game/Blueprints/", description="Asset path where to create the blueprint")
@@ -60,56 +125,61 @@ class BlueprintCreateParams(BaseModel):
     @classmethod
     def validate_blueprint_name(cls, v):
         result = SecurityValidator.validate_blueprint_name(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid blueprint name: {'; '.join(result['errors'])}")
+        if not result.valid:
+            raise ValueError(f"Invalid blueprint name: {'; '.join(result.errors)}")
         return v
 
     @field_validator('parent_class')
     @classmethod
     def validate_parent_class(cls, v):
         result = SecurityValidator.validate_parent_class(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid parent class: {'; '.join(result['errors'])}")
+        if not result.valid:
+            raise ValueError(f"Invalid parent class: {'; '.join(result.errors)}")
         return v
 
     @field_validator('asset_path')
     @classmethod
     def validate_asset_path(cls, v):
         result = SecurityValidator.validate_asset_path(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid asset path: {'; '.join(result['errors'])}")
-        return result["normalized_path"]
+        if not result.valid:
+            raise ValueError(f"Invalid asset path: {'; '.join(result.errors)}")
+        return result.normalized_path
 
 class BlueprintPropertyParams(BaseModel):
     """Parameters for setting blueprint properties with security validation"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     blueprint_path: str = Field(description="Full path to the blueprint asset (e.g., '/Game/Blueprints/MyTestActor')")
     property_name: str = Field(description="Name of the property to modify")
-    property_value: str = Field(description="New value for the property as string")
+    property_value: Union[str, Tuple[float, float, float]] = Field(description="New value for the property as string, or [x, y, z] numbers for a Vector")
     property_type: Optional[str] = Field(default=None, description="Type hint for the property (int, float, bool, string, Vector, etc.)")
 
     @field_validator('blueprint_path')
     @classmethod
     def validate_blueprint_path(cls, v):
         result = SecurityValidator.validate_asset_path(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid blueprint path: {'; '.join(result['errors'])}")
-        return result["normalized_path"]
+        if not result.valid:
+            raise ValueError(f"Invalid blueprint path: {'; '.join(result.errors)}")
+        return result.normalized_path
 
     @field_validator('property_name')
     @classmethod
     def validate_property_name(cls, v):
         result = SecurityValidator.validate_property_name(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid property name: {'; '.join(result['errors'])}")
+        if not result.valid:
+            raise ValueError(f"Invalid property name: {'; '.join(result.errors)}")
         return v
 
     @field_validator('property_value')
     @classmethod
     def validate_property_value(cls, v):
         result = SecurityValidator.validate_property_value(v)
-        if not result["valid"]:
-            raise ValueError(f"Invalid property value: {'; '.join(result['errors'])}")
-        return result["sanitized_value"]
+        if not result.valid:
+            raise ValueError(f"Invalid property value: {'; '.join(result.errors)}")
+        # Vectors come back as a list; keep the tuple the field is declared as
+        if isinstance(result.sanitized_value, list):
+            return tuple(result.sanitized_value)
+        return result.sanitized_value
 
 # Create FastMCP server instance
 mcp = FastMCP("UnrealBlueprintMCPServer")
@@ -117,28 +187,127 @@ mcp = FastMCP("UnrealBlueprintMCPServer")
 # Global variables for WebSocket server management with memory optimization
 WS_HOST = "localhost"
 WS_PORT = 8080
+WS_URL = f"ws://{WS_HOST}:{WS_PORT}"
 MAX_CLIENTS = 50  # Limit concurrent connections
+MAX_MESSAGE_SIZE = 1024 * 1024  # Largest accepted frame, as in validate_websocket_message_size
+OUTBOUND_QUEUE_SIZE = 256  # Commands waiting to be written to one client
+CLOSE_TIMEOUT = 5.0  # Seconds a client gets to complete the closing handshake before it is dropped
 CLIENTS: Set[Connection] = set()
 unreal_client: Optional[Connection] = None
 ws_server: Optional[Server] = None
-last_connection_attempt: Optional[datetime] = None
+last_connection_attempt: Optional[float] = None  # time.time(); converted to a datetime only for status
 connection_status = "server_not_started"
 server_start_time: Optional[datetime] = None
 
 # Memory management
 memory_manager: Optional[MemoryManager] = None
-client_weak_refs: List[weakref.ref] = []  # Weak references to prevent memory leaks
-connection_timeouts: Dict[str, datetime] = {}  # Track connection timeouts
+client_weak_refs: "weakref.WeakSet[Connection]" = weakref.WeakSet()  # Drops clients once collected
 INACTIVE_TIMEOUT = 300.0  # 5 minutes timeout for inactive connections
+_process = psutil.Process()  # This process, looked up once for memory status
+
+# Fewer automatic collections of the older generations; the server keeps many
+# long-lived objects that a full collection would walk every time
+GC_THRESHOLDS = (10000, 15, 15)
+FULL_GC_CLEANUP_COUNT = 10  # Closed connections that justify a full collection
+
+# Collections and pause time per generation, recorded by the gc callback so
+# status reports never need a manual collection
+gc_pause_stats: Dict[str, List[float]] = {"collections": [0, 0, 0], "pause_seconds": [0.0, 0.0, 0.0]}
+_gc_started = 0.0
+
+def _on_gc(phase: str, info: Dict[str, int]):
+    """gc callback that times each collection"""
+    global _gc_started
+    if phase == "start":
+        _gc_started = time.perf_counter()
+    else:
+        generation = info["generation"]
+        gc_pause_stats["collections"][generation] += 1
+        gc_pause_stats["pause_seconds"][generation] += time.perf_counter() - _gc_started
+
+# Replies from Unreal are read only by the register_client loop, which hands
+# each one to the send_command_to_unreal call waiting on its JSON-RPC id
+pending_responses: Dict[str, asyncio.Future] = {}
+
+@dataclass
+class ClientState:
+    """Everything the server tracks for one connected client"""
+    address: str  # "host:port", formatted once
+    # Commands are written by one writer task per client, fed through this
+    # bounded queue, so concurrent tool calls never contend for the connection
+    outbound: asyncio.Queue
+    last_active: float  # time.monotonic() the client last sent a frame
+
+# Per-client state in last-activity order, least recently active first
+client_states: "OrderedDict[Connection, ClientState]" = OrderedDict()
+
+# The event loop keeps only weak references to tasks, so fire-and-forget
+# tasks are held here until they finish
+_background_tasks: Set[asyncio.Task] = set()
+
+def _spawn(coro) -> asyncio.Task:
+    """Start a task and keep a reference to it until it is done"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+# Periodic cleanup of the running WebSocket server, cancelled when it stops
+cleanup_task: Optional[asyncio.Task] = None
+
+# JSON-RPC ids only have to be unique among this process's requests, so a
+# counter is enough (no random UUID per command)
+_next_message_id = itertools.count(1).__next__
+
+# Parent classes supported by the Unreal plugin, built once at import
+SUPPORTED_BLUEPRINT_CLASSES = (
+    "Actor",
+    "Pawn",
+    "Character",
+    "ActorComponent",
+    "SceneComponent",
+    "UserWidget",
+    "Object"
+)
+
+# Tool names reported by get_server_status, built once at import
+AVAILABLE_TOOLS = (
+    "create_blueprint",
+    "set_blueprint_property",
+    "list_supported_blueprint_classes",
+    "create_test_actor_blueprint",
+    "test_unreal_connection",
+    "start_websocket_server",
+    "stop_websocket_server"
+)
 
 # WebSocket Connection Management with Memory Optimization
+async def _drain_outbound(websocket: Connection, queue: asyncio.Queue):
+    """Write queued (message_id, frame) pairs to a client until it goes away
+
+    Notifications are queued with a message_id of None.
+    """
+    while True:
+        message_id, payload = await queue.get()
+        try:
+            # The payload is already UTF-8 JSON, so send it as a text frame
+            # without decoding it back to str
+            await websocket.send(payload, text=True)
+        except Exception as e:
+            # Hand the failure to the caller waiting on this command
+            future = pending_responses.get(message_id)
+            if future is not None and not future.done():
+                future.set_exception(e)
+            if isinstance(e, websockets.ConnectionClosed):
+                return
+
 async def register_client(websocket: Connection):
     """Register a new Unreal Engine client connection with memory management"""
     global unreal_client, connection_status, last_connection_attempt, memory_manager
 
     # Check connection limit
     if len(CLIENTS) >= MAX_CLIENTS:
-        logger.warning(f"Connection limit reached ({MAX_CLIENTS}), rejecting new connection")
+        logger.warning("Connection limit reached (%d), rejecting new connection", MAX_CLIENTS)
         await websocket.close(code=1013, reason="Server overloaded")
         return
 
@@ -155,58 +324,94 @@ async def register_client(websocket: Connection):
 
     CLIENTS.add(websocket)
     unreal_client = websocket
-    last_connection_attempt = datetime.now()
+    last_connection_attempt = time.time()
     connection_status = "connected"
 
-    # Track with weak reference
-    client_id = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-    connection_timeouts[client_id] = datetime.now()
+    # IPv6 addresses carry flow info and scope id after host and port
+    host, port = websocket.remote_address[:2]
+    client_info = f"{host}:{port}"
+    state = ClientState(
+        address=client_info,
+        outbound=asyncio.Queue(maxsize=OUTBOUND_QUEUE_SIZE),
+        last_active=time.monotonic()
+    )
+    client_states[websocket] = state
 
-    def cleanup_ref(ref):
-        logger.debug(f"Client {client_id} cleaned up by weak reference")
-        connection_timeouts.pop(client_id, None)
+    # Track with weak reference
+    client_weak_refs.add(websocket)
 
-    weak_ref = weakref.ref(websocket, cleanup_ref)
-    client_weak_refs.append(weak_ref)
+    writer = asyncio.create_task(_drain_outbound(websocket, state.outbound))
 
-    client_info = f"{websocket.remote_address[0]}:{websocket.remote_address[1]}"
-    logger.info(f"Unreal Engine client connected from {client_info} (Total: {len(CLIENTS)})")
+    logger.info("Unreal Engine client connected from %s (Total: %d)", client_info, len(CLIENTS))
 
     try:
         # Keep connection alive and handle messages
-        async for message in websocket:
+        while True:
+            # Read frames as raw bytes and let the JSON parser validate the
+            # UTF-8 in the same pass. Oversized frames are rejected by the
+            # connection itself (max_size), which closes it with code 1009
+            message = await websocket.recv(decode=False)
+            state.last_active = time.monotonic()
+            if websocket in client_states:  # Unless an idle cleanup already dropped it
+                client_states.move_to_end(websocket)
             try:
-                # Validate message size for security
-                if not SecurityValidator.validate_websocket_message_size(message):
-                    logger.warning(f"Oversized message received from client {client_info}, dropping connection")
-                    break
-
-                data = json.loads(message)
-                logger.info(f"Received from Unreal: {data}")
+                data = _json_loads(message)
+
+                # Replies to our own requests go to the waiting caller
+                reply_id = data.get("id") if isinstance(data, dict) else None
+                future = pending_responses.pop(reply_id, None) if isinstance(reply_id, str) else None
+                if future is not None:
+                    # Logged from the frame as received, not re-serialized
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Received from Unreal: %s", message.decode())
+                    if not future.done():
+                        future.set_result(data)
+                    continue
+
+                logger.info("Received from Unreal: %s", data)
                 # Here we could handle unsolicited messages from Unreal if needed
-            except json.JSONDecodeError as e:
-                logger.warning(f"Invalid JSON received from client: {e}")
+            except (json.JSONDecodeError, UnicodeDecodeError) as e:
+                logger.warning("Invalid JSON received from client: %s", e)
             except Exception as e:
-                logger.error(f"Error processing message from client {client_info}: {e}")
+                logger.error("Error processing message from client %s: %s", client_info, e)
                 break
 
     except websockets.ConnectionClosed:
-        logger.info(f"Client {client_info} disconnected")
+        logger.info("Client %s disconnected", client_info)
     except Exception as e:
-        logger.error(f"Error handling client {client_info}: {e}")
+        logger.error("Error handling client %s: %s", client_info, e)
     finally:
+        writer.cancel()
         await unregister_client(websocket)
+        await asyncio.gather(writer, return_exceptions=True)
 
 async def unregister_client(websocket: Connection):
     """Unregister a client connection"""
     global unreal_client, connection_status
 
     CLIENTS.discard(websocket)
+    client_states.pop(websocket, None)
+    # Drop every reference to the connection here so it is freed as soon as
+    # the handler returns, not left to a later sweep
+    if memory_manager:
+        memory_manager.unregister_connection(websocket)
     if unreal_client == websocket:
         unreal_client = None
         connection_status = "disconnected"
         logger.info("Primary Unreal Engine client disconnected")
 
+        # No replies can arrive any more for requests still in flight
+        for future in pending_responses.values():
+            if not future.done():
+                future.set_exception(ConnectionError("Connection to Unreal Engine was closed during communication"))
+        pending_responses.clear()
+
+@functools.lru_cache(maxsize=64)
+def _request_prefix(method: str) -> bytes:
+    """Encoded start of a JSON-RPC 2.0 request for method, up to its params value"""
+    header = _json_dumps({"jsonrpc": "2.0", "method": method})
+    return header[:-1] + b',"params":'
+
 async def send_command_to_unreal(method: str, params: Dict[str, Any], timeout: float = 10.0) -> Dict[str, Any]:
     """
     Send a command to connected Unreal Engine client via WebSocket
@@ -224,58 +429,57 @@ async def send_command_to_unreal(method: str, params: Dict[str, Any], timeout: f
         TimeoutError: If Unreal doesn't respond within timeout
         ValueError: If Unreal returns an error response
     """
-    # Ensure WebSocket server is running
-    await ensure_websocket_server()
     global unreal_client, last_connection_attempt, connection_status
 
+    # Ensure WebSocket server is running; checked inline so the common case
+    # does not create and await a coroutine on every command
+    if not ws_server or not ws_server.is_serving():
+        await ensure_websocket_server()
+
     if not unreal_client:
         connection_status = "no_client"
         raise ConnectionError("No Unreal Engine client is currently connected. Please ensure the UnrealBlueprintMCP plugin is running and connected.")
 
     # Generate unique message ID
-    message_id = str(uuid.uuid4())
+    message_id = str(_next_message_id())
 
     # Sanitize parameters for security
     sanitized_params = SecurityValidator.sanitize_json_rpc_params(params)
 
-    # Create JSON-RPC 2.0 message
-    message = {
-        "jsonrpc": "2.0",
-        "id": message_id,
-        "method": html.escape(method, quote=True),
-        "params": sanitized_params
-    }
-
-    # Validate message size before sending
-    message_str = json.dumps(message)
-    if not SecurityValidator.validate_websocket_message_size(message_str):
+    # Create the JSON-RPC 2.0 message. Only params and id change between
+    # calls, so the encoded header for each method is reused; the id is a
+    # decimal counter and needs no escaping. The same bytes are size-checked,
+    # logged and sent
+    payload = b"".join((
+        _request_prefix(method),
+        _json_dumps(sanitized_params),
+        b',"id":"', message_id.encode(), b'"}'
+    ))
+    if len(payload) > MAX_MESSAGE_SIZE:
         raise ValueError("Message too large to send safely over WebSocket")
 
-    last_connection_attempt = datetime.now()
-    logger.info(f"Sending to Unreal: {json.dumps(message)}")
-
-    try:
-        # Send message to Unreal
-        await unreal_client.send(message_str)
-
-        # Wait for response with timeout
-        response_str = await asyncio.wait_for(unreal_client.recv(), timeout=timeout)
+    last_connection_attempt = time.time()
+    # Full frames are only logged at DEBUG level
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Sending to Unreal: %s", payload.decode())
 
-        # Validate response size
-        if not SecurityValidator.validate_websocket_message_size(response_str):
-            raise ValueError("Response too large received from Unreal Engine")
+    # The reply is delivered by register_client, which owns the receive side
+    # of the connection, so several commands can be in flight at once
+    response_future = asyncio.get_running_loop().create_future()
+    pending_responses[message_id] = response_future
 
-        response = json.loads(response_str)
-
-        logger.info(f"Received from Unreal: {json.dumps(response)}")
+    try:
+        # Queue the message for the client's writer task and wait for the
+        # reply. A full queue blocks the put, so it counts against the same
+        # timeout as the response
+        async with async_timeout(timeout):
+            await client_states[unreal_client].outbound.put((message_id, payload))
+            response = await response_future
 
         # Validate JSON-RPC response
         if response.get("jsonrpc") != "2.0":
             raise ValueError("Invalid JSON-RPC response from Unreal")
 
-        if response.get("id") != message_id:
-            raise ValueError("Response ID mismatch from Unreal")
-
         # Check for RPC error
         if "error" in response:
             error = response["error"]
@@ -290,21 +494,62 @@ async def send_command_to_unreal(method: str, params: Dict[str, Any], timeout: f
         await unregister_client(unreal_client)
         raise ConnectionError("Connection to Unreal Engine was closed during communication")
 
+    except ConnectionError:
+        # Raised through the pending future when the client disconnects
+        connection_status = "disconnected"
+        logger.error("Connection to Unreal Engine was closed")
+        raise
+
     except asyncio.TimeoutError:
+        pending_responses.pop(message_id, None)
         connection_status = "timeout"
-        logger.error(f"Timeout waiting for response from Unreal Engine (>{timeout}s)")
+        logger.error("Timeout waiting for response from Unreal Engine (>%ss)", timeout)
         raise TimeoutError(f"No response from Unreal Engine within {timeout} seconds")
 
-    except json.JSONDecodeError as e:
-        connection_status = "protocol_error"
-        logger.error(f"Invalid JSON response from Unreal: {e}")
-        raise ValueError(f"Invalid JSON response from Unreal Engine: {e}")
-
     except Exception as e:
         connection_status = "error"
-        logger.error(f"Unexpected error communicating with Unreal: {e}")
+        logger.error("Unexpected error communicating with Unreal: %s", e)
         raise
 
+    finally:
+        pending_responses.pop(message_id, None)
+
+def broadcast_to_unreal(method: str, params: Dict[str, Any]) -> int:
+    """
+    Send a JSON-RPC notification to every connected Unreal Engine client
+
+    The notification is serialized once and queued on each client's outbound
+    queue, so it is written by that client's writer task in order with its
+    commands; no reply is expected. Clients whose queue is full are skipped.
+
+    Args:
+        method: The RPC method to notify
+        params: Parameters for the method
+
+    Returns:
+        Number of connected clients the notification was queued for
+    """
+    if not client_states:
+        return 0
+
+    sanitized_params = SecurityValidator.sanitize_json_rpc_params(params)
+    payload = _request_prefix(method) + _json_dumps(sanitized_params) + b"}"
+    if len(payload) > MAX_MESSAGE_SIZE:
+        raise ValueError("Message too large to send safely over WebSocket")
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Broadcasting to Unreal: %s", payload.decode())
+
+    # No message id: nobody waits on a reply, so a failed write is dropped
+    sent = 0
+    for state in client_states.values():
+        try:
+            state.outbound.put_nowait((None, payload))
+            sent += 1
+        except asyncio.QueueFull:
+            logger.warning("Outbound queue full for %s, notification dropped", state.address)
+    return sent
+
 # Core logic function without decorator
 async def _create_blueprint_logic(params: BlueprintCreateParams) -> Dict[str, Any]:
     """
@@ -327,14 +572,10 @@ async def _create_blueprint_logic(params: BlueprintCreateParams) -> Dict[str, An
             "asset_path": "/Game/Blueprints/"
         })
     """
-    logger.info(f"Creating blueprint: {params.blueprint_name} (parent: {params.parent_class})")
+    logger.info("Creating blueprint: %s (parent: %s)", params.blueprint_name, params.parent_class)
 
-    # Prepare parameters for Unreal plugin
-    unreal_params = {
-        "blueprint_name": params.blueprint_name,
-        "parent_class": params.parent_class,
-        "asset_path": params.asset_path
-    }
+    # The model's fields are the plugin's parameters, already validated
+    unreal_params = params.model_dump()
 
     try:
         # Send command to Unreal Engine
@@ -352,20 +593,12 @@ async def _create_blueprint_logic(params: BlueprintCreateParams) -> Dict[str, An
         }
 
     except (ConnectionError, TimeoutError, ValueError) as e:
-        logger.error(f"Failed to create blueprint: {e}")
+        logger.error("Failed to create blueprint: %s", e)
         return {
             "success": False,
             "error": str(e),
             "message": f"Failed to create blueprint '{params.blueprint_name}': {e}"
         }
-    except Exception as e:
-        logger.error(f"Unexpected error creating blueprint: {e}")
-        logger.error(traceback.format_exc())
-        return {
-            "success": False,
-            "error": f"Unexpected error: {e}",
-            "message": f"Failed to create blueprint '{params.blueprint_name}' due to unexpected error"
-        }
 
 @mcp.tool()
 async def create_blueprint(params: BlueprintCreateParams) -> Dict[str, Any]:
@@ -381,9 +614,6 @@ async def create_blueprint(params: BlueprintCreateParams) -> Dict[str, Any]:
 async def _set_blueprint_property_logic(params: BlueprintPropertyParams) -> Dict[str, Any]:
     """
     Sets a property value on an existing Blueprint asset's CDO (Class Default Object).
-    """
-    """
-    Sets a property value on an existing Blueprint asset's CDO (Class Default Object).
 
     This tool modifies properties on blueprint assets using the UnrealBlueprintMCP plugin.
     It supports various property types including primitives (int, float, bool, string) and
@@ -403,15 +633,10 @@ async def _set_blueprint_property_logic(params: BlueprintPropertyParams) -> Dict
             "property_type": "int"
         })
     """
-    logger.info(f"Setting property '{params.property_name}' = '{params.property_value}' on {params.blueprint_path}")
+    logger.info("Setting property '%s' = '%s' on %s", params.property_name, params.property_value, params.blueprint_path)
 
-    # Prepare parameters for Unreal plugin
-    unreal_params = {
-        "blueprint_path": params.blueprint_path,
-        "property_name": params.property_name,
-        "property_value": params.property_value,
-        "property_type": params.property_type
-    }
+    # The model's fields are the plugin's parameters, already validated
+    unreal_params = params.model_dump()
 
     try:
         # Send command to Unreal Engine
@@ -428,20 +653,22 @@ async def _set_blueprint_property_logic(params: BlueprintPropertyParams) -> Dict
         }
 
     except (ConnectionError, TimeoutError, ValueError) as e:
-        logger.error(f"Failed to set property: {e}")
+        logger.error("Failed to set property: %s", e)
         return {
             "success": False,
             "error": str(e),
             "message": f"Failed to set property '{params.property_name}': {e}"
         }
-    except Exception as e:
-        logger.error(f"Unexpected error setting property: {e}")
-        logger.error(traceback.format_exc())
-        return {
-            "success": False,
-            "error": f"Unexpected error: {e}",
-            "message": f"Failed to set property '{params.property_name}' due to unexpected error"
-        }
+
+@mcp.tool()
+async def set_blueprint_property(params: BlueprintPropertyParams) -> Dict[str, Any]:
+    """
+    Sets a property value on an existing Blueprint asset's CDO (Class Default Object).
+
+    This tool sends a set_property command to the UnrealBlueprintMCP plugin,
+    which applies the value to the blueprint's default object in the Unreal Editor.
+    """
+    return await _set_blueprint_property_logic(params)
 
 @mcp.tool()
 async def get_server_status() -> Dict[str, Any]:
@@ -451,47 +678,26 @@ async def get_server_status() -> Dict[str, Any]:
     Returns:
         Status information including connection state, last attempt time, and server info
     """
-    global last_connection_attempt, connection_status, server_start_time, ws_server
-
-    # Count active connections
-    active_connections = len(CLIENTS)
-    has_primary_client = unreal_client is not None
-
-    # WebSocket server status
-    ws_server_status = "stopped"
-    if ws_server:
-        if ws_server.is_serving():
-            ws_server_status = "running"
-        else:
-            ws_server_status = "stopped"
-
     return {
         "server_name": "UnrealBlueprintMCPServer",
         "version": "2.0.0",
         "websocket_server": {
-            "status": ws_server_status,
+            "status": "running" if ws_server and ws_server.is_serving() else "stopped",
             "host": WS_HOST,
             "port": WS_PORT,
-            "url": f"ws://{WS_HOST}:{WS_PORT}"
+            "url": WS_URL
         },
         "connection_status": connection_status,
         "client_connections": {
-            "active_count": active_connections,
-            "has_primary_client": has_primary_client,
-            "primary_client_address": f"{unreal_client.remote_address[0]}:{unreal_client.remote_address[1]}" if unreal_client else None
+            "active_count": len(CLIENTS),
+            "has_primary_client": unreal_client is not None,
+            "primary_client_address": client_states[unreal_client].address if unreal_client in client_states else None
         },
-        "last_connection_attempt": last_connection_attempt.isoformat() if last_connection_attempt else None,
+        "last_connection_attempt": datetime.fromtimestamp(last_connection_attempt).isoformat() if last_connection_attempt else None,
         "server_start_time": server_start_time.isoformat() if server_start_time else None,
         "timestamp": datetime.now().isoformat(),
-        "available_tools": [
-            "create_blueprint",
-            "set_blueprint_property",
-            "list_supported_blueprint_classes",
-            "create_test_actor_blueprint",
-            "test_unreal_connection",
-            "start_websocket_server",
-            "stop_websocket_server"
-        ]
+        # Fresh list so callers cannot modify the shared tuple
+        "available_tools": list(AVAILABLE_TOOLS)
     }
 
 @mcp.tool()
@@ -511,15 +717,8 @@ async def list_supported_blueprint_classes() -> List[str]:
     - UserWidget: UI widget classes
     - Object: Base UObject class
     """
-    return [
-        "Actor",
-        "Pawn",
-        "Character",
-        "ActorComponent",
-        "SceneComponent",
-        "UserWidget",
-        "Object"
-    ]
+    # Return a fresh list so callers cannot modify the shared tuple
+    return list(SUPPORTED_BLUEPRINT_CLASSES)
 
 @mcp.tool()
 async def create_test_actor_blueprint(
@@ -545,51 +744,60 @@ async def create_test_actor_blueprint(
             location={"x": 100, "y": 200, "z": 300}
         )
     """
-    logger.info(f"Creating test actor blueprint: {blueprint_name} at location {location}")
+    # Formatted once for the log and the result message; Unreal gets the
+    # coordinates as JSON numbers
+    location_str = str(location)
+    logger.info("Creating test actor blueprint: %s at location %s", blueprint_name, location_str)
 
     try:
-        # Step 1: Create blueprint
         create_params = BlueprintCreateParams(
             blueprint_name=blueprint_name,
             parent_class="Actor",
             asset_path="/Game/Blueprints/"
         )
+        blueprint_path = f"{create_params.asset_path.rstrip('/')}/{create_params.blueprint_name}"
 
-        create_result = await _create_blueprint_logic(create_params)
-
-        if not create_result.get("success"):
-            return {
-                "success": False,
-                "message": f"Failed to create test actor blueprint: {blueprint_name}",
-                "error": create_result
-            }
-
-        # Step 2: Set location property
+        # Validated as a set_blueprint_property call on the new blueprint would be
         property_params = BlueprintPropertyParams(
-            blueprint_path=create_result["blueprint_path"],
+            blueprint_path=blueprint_path,
             property_name="RootComponent",
-            property_value=str(location),
+            property_value=[location.x, location.y, location.z],
             property_type="Vector"
         )
 
-        property_result = await set_blueprint_property(property_params)
+        # One command creates the blueprint and sets its properties, so the
+        # tool costs a single round trip to Unreal
+        unreal_params = create_params.model_dump()
+        unreal_params["properties"] = {property_params.property_name: property_params.property_value}
+        result = await send_command_to_unreal("create_blueprint_with_properties", unreal_params)
 
+        # Same shape as when creation and the property were separate
+        # commands; both entries carry the one reply from Unreal
         return {
             "success": True,
-            "message": f"Test actor blueprint '{blueprint_name}' created successfully with location {location}",
-            "blueprint_creation": create_result,
-            "property_setting": property_result,
-            "final_blueprint_path": create_result["blueprint_path"],
-            "location": {
-                "x": location.x,
-                "y": location.y,
-                "z": location.z
-            }
+            "message": f"Test actor blueprint '{blueprint_name}' created successfully with location {location_str}",
+            "blueprint_creation": {
+                "success": True,
+                "message": f"Blueprint '{blueprint_name}' created successfully",
+                "blueprint_path": blueprint_path,
+                "parent_class": create_params.parent_class,
+                "unreal_response": result
+            },
+            "property_setting": {
+                "success": True,
+                "message": f"Property '{property_params.property_name}' set successfully",
+                "blueprint_path": blueprint_path,
+                "property_name": property_params.property_name,
+                "property_value": property_params.property_value,
+                "property_type": property_params.property_type,
+                "unreal_response": result
+            },
+            "final_blueprint_path": blueprint_path,
+            "location": location.model_dump()
         }
 
-    except Exception as e:
-        logger.error(f"Error creating test actor blueprint: {e}")
-        logger.error(traceback.format_exc())
+    except (ConnectionError, TimeoutError, ValueError) as e:
+        logger.error("Failed to create test actor blueprint: %s", e)
         return {
             "success": False,
             "message": f"Failed to create test actor blueprint: {blueprint_name}",
@@ -611,42 +819,36 @@ async def test_unreal_connection() -> Dict[str, Any]:
     logger.info("Testing connection to Unreal Engine...")
 
     try:
-        start_time = datetime.now()
+        # Wall-clock time only for the report; the round trip is timed with
+        # the monotonic performance counter
+        test_timestamp = datetime.now().isoformat()
+        start_counter = time.perf_counter()
 
         # Send a simple ping command with current timestamp
         result = await send_command_to_unreal("ping", {
-            "timestamp": start_time.isoformat(),
+            "timestamp": test_timestamp,
             "test_message": "Connection test from MCP server"
         })
 
-        end_time = datetime.now()
-        response_time = (end_time - start_time).total_seconds()
+        response_time = time.perf_counter() - start_counter
 
         return {
             "success": True,
             "message": "Connection test completed successfully",
             "response_time_seconds": response_time,
-            "test_timestamp": start_time.isoformat(),
+            "test_timestamp": test_timestamp,
             "unreal_response": result,
             "connection_status": connection_status
         }
 
     except (ConnectionError, TimeoutError, ValueError) as e:
-        logger.error(f"Connection test failed: {e}")
+        logger.error("Connection test failed: %s", e)
         return {
             "success": False,
             "error": str(e),
             "message": f"Connection test failed: {e}",
             "connection_status": connection_status
         }
-    except Exception as e:
-        logger.error(f"Unexpected error during connection test: {e}")
-        logger.error(traceback.format_exc())
-        return {
-            "success": False,
-            "error": f"Unexpected error: {e}",
-            "message": "Connection test failed due to unexpected error"
-        }
 
 # WebSocket Server Management Tools
 
@@ -658,51 +860,61 @@ async def _start_websocket_server_logic() -> Dict[str, Any]:
     Returns:
         Status of the server start operation
     """
-    global ws_server, server_start_time, connection_status
+    global ws_server, server_start_time, connection_status, cleanup_task
 
     if ws_server and ws_server.is_serving():
         return {
             "success": False,
             "message": "WebSocket server is already running",
-            "server_url": f"ws://{WS_HOST}:{WS_PORT}",
+            "server_url": WS_URL,
             "start_time": server_start_time.isoformat() if server_start_time else None
         }
 
+    if _on_gc not in gc.callbacks:
+        gc.set_threshold(*GC_THRESHOLDS)
+        gc.callbacks.append(_on_gc)
+
     try:
         # Start WebSocket server
-        ws_server = await serve(register_client, WS_HOST, WS_PORT)
+        # JSON-RPC frames are small, so per-message deflate is not worth its cost
+        ws_server = await serve(
+            register_client, WS_HOST, WS_PORT,
+            compression=None,
+            max_size=MAX_MESSAGE_SIZE,
+            close_timeout=CLOSE_TIMEOUT
+        )
         server_start_time = datetime.now()
         connection_status = "server_running"
+        cleanup_task = _spawn(background_cleanup_task())
 
-        logger.info(f"WebSocket server started on ws://{WS_HOST}:{WS_PORT}")
+        logger.info("WebSocket server started on %s", WS_URL)
 
         return {
             "success": True,
             "message": "WebSocket server started successfully",
-            "server_url": f"ws://{WS_HOST}:{WS_PORT}",
+            "server_url": WS_URL,
             "start_time": server_start_time.isoformat(),
             "host": WS_HOST,
             "port": WS_PORT
         }
 
     except OSError as e:
-        if e.errno == 48:  # Address already in use
-            logger.error(f"Port {WS_PORT} is already in use")
+        if e.errno == errno.EADDRINUSE:
+            logger.error("Port %s is already in use", WS_PORT)
             return {
                 "success": False,
                 "error": f"Port {WS_PORT} is already in use",
                 "message": "Another application is using the WebSocket port"
             }
         else:
-            logger.error(f"Failed to start WebSocket server: {e}")
+            logger.error("Failed to start WebSocket server: %s", e)
             return {
                 "success": False,
                 "error": str(e),
                 "message": "Failed to start WebSocket server"
             }
     except Exception as e:
-        logger.error(f"Unexpected error starting WebSocket server: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Unexpected error starting WebSocket server")
         return {
             "success": False,
             "error": str(e),
@@ -727,7 +939,7 @@ async def _stop_websocket_server_logic() -> Dict[str, Any]:
     Returns:
         Status of the server stop operation
     """
-    global ws_server, connection_status, unreal_client
+    global ws_server, connection_status, unreal_client, cleanup_task
 
     if not ws_server or not ws_server.is_serving():
         return {
@@ -738,15 +950,19 @@ async def _stop_websocket_server_logic() -> Dict[str, Any]:
     try:
         # Close all client connections
         if CLIENTS:
-            await asyncio.gather(
-                *[client.close() for client in CLIENTS.copy()],
-                return_exceptions=True
-            )
+            # Each close() coroutine already holds its client, so the set can be
+            # cleared before they run. close() gives up after CLOSE_TIMEOUT and
+            # aborts the connection, so an unresponsive client cannot stall it
+            closers = [client.close(code=1001, reason="Server shutting down") for client in CLIENTS]
             CLIENTS.clear()
+            await asyncio.gather(*closers, return_exceptions=True)
 
         # Stop the server
         ws_server.close()
         await ws_server.wait_closed()
+        if cleanup_task:
+            cleanup_task.cancel()
+            cleanup_task = None
 
         ws_server = None
         unreal_client = None
@@ -760,8 +976,7 @@ async def _stop_websocket_server_logic() -> Dict[str, Any]:
         }
 
     except Exception as e:
-        logger.error(f"Error stopping WebSocket server: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception("Error stopping WebSocket server")
         return {
             "success": False,
             "error": str(e),
@@ -783,33 +998,34 @@ async def stop_websocket_server() -> Dict[str, Any]:
 @mcp.tool()
 async def cleanup_inactive_connections() -> Dict[str, Any]:
     """Cleanup inactive WebSocket connections to free memory"""
-    global connection_timeouts
-
-    current_time = datetime.now()
-    inactive_clients = []
     cleaned_count = 0
 
-    # Find inactive connections
-    for client_id, last_activity in connection_timeouts.items():
-        if (current_time - last_activity).total_seconds() > INACTIVE_TIMEOUT:
-            inactive_clients.append(client_id)
+    # client_states is kept in last-activity order, so the expired clients
+    # are all at the front and the scan stops at the first live one.
+    # The list lets unregister_client change the dict while closing below
+    cutoff = time.monotonic() - INACTIVE_TIMEOUT
+    inactive_clients = []
+    for client, state in client_states.items():
+        if state.last_active >= cutoff:
+            break
+        inactive_clients.append(client)
 
     # Close inactive connections
-    for client in CLIENTS.copy():
+    for client in inactive_clients:
         try:
-            client_info = f"{client.remote_address[0]}:{client.remote_address[1]}"
-            if client_info in inactive_clients:
-                await unregister_client(client)
-                await client.close(code=1000, reason="Inactive timeout")
-                cleaned_count += 1
+            await unregister_client(client)
+            await client.close(code=1000, reason="Inactive timeout")
+            cleaned_count += 1
         except Exception as e:
-            logger.warning(f"Error closing inactive connection: {e}")
+            logger.warning("Error closing inactive connection: %s", e)
 
-    # Force garbage collection
+    # Force garbage collection; without the memory manager only the young
+    # generations are collected unless many connections were just dropped
     if memory_manager:
         gc_stats = memory_manager.force_garbage_collection()
     else:
-        gc_stats = {"total_collected": gc.collect()}
+        generation = 2 if cleaned_count >= FULL_GC_CLEANUP_COUNT else 1
+        gc_stats = {"total_collected": gc.collect(generation)}
 
     return {
         "success": True,
@@ -823,58 +1039,36 @@ async def cleanup_inactive_connections() -> Dict[str, Any]:
 async def get_memory_status() -> Dict[str, Any]:
     """Get detailed memory status for the server"""
     if memory_manager:
-        return memory_manager.get_status()
+        status = memory_manager.get_status()
+        status["gc_pauses"] = gc_pause_stats
+        return status
     else:
-        import psutil
-        process = psutil.Process()
-        memory_info = process.memory_info()
+        memory_info = _process.memory_info()
 
         return {
             "memory_manager": "not_initialized",
             "current_memory_mb": memory_info.rss / (1024 * 1024),
-            "memory_percent": process.memory_percent(),
+            "memory_percent": _process.memory_percent(),
             "active_connections": len(CLIENTS),
             "weak_refs": len(client_weak_refs),
-            "connection_timeouts": len(connection_timeouts)
+            "client_states": len(client_states),
+            "gc_pauses": gc_pause_stats
         }
 
-async def cleanup_dead_references() -> int:
-    """Cleanup dead weak references"""
-    global client_weak_refs
-
-    alive_refs = []
-    dead_count = 0
-
-    for ref in client_weak_refs:
-        if ref() is not None:
-            alive_refs.append(ref)
-        else:
-            dead_count += 1
-
-    client_weak_refs = alive_refs
-
-    if dead_count > 0:
-        logger.debug(f"Cleaned up {dead_count} dead client references")
-
-    return dead_count
-
 async def background_cleanup_task():
     """Background task for periodic cleanup"""
     while ws_server and ws_server.is_serving():
         try:
             await asyncio.sleep(60)  # Run every minute
 
-            # Cleanup dead references
-            await cleanup_dead_references()
-
             # Check for inactive connections every 5 minutes
-            if len(connection_timeouts) > 0:
+            if client_states:
                 await cleanup_inactive_connections()
 
         except asyncio.CancelledError:
             break
         except Exception as e:
-            logger.error(f"Error in background cleanup task: {e}")
+            logger.error("Error in background cleanup task: %s", e)
 
 # Server initialization - this will be called by FastMCP
 async def initialize_server():
@@ -887,9 +1081,9 @@ async def initialize_server():
         if result["success"]:
             logger.info("WebSocket server initialized successfully")
         else:
-            logger.warning(f"Failed to initialize WebSocket server: {result['message']}")
+            logger.warning("Failed to initialize WebSocket server: %s", result["message"])
     except Exception as e:
-        logger.error(f"Error during server initialization: {e}")
+        logger.error("Error during server initialization: %s", e)
 
 # Initialize WebSocket server automatically when tools are first used
 async def ensure_websocket_server():
@@ -899,7 +1093,7 @@ async def ensure_websocket_server():
         logger.info("Auto-starting WebSocket server for Unreal Engine connections...")
         result = await _start_websocket_server_logic()
         if not result["success"]:
-            logger.warning(f"Failed to auto-start WebSocket server: {result['message']}")
+            logger.warning("Failed to auto-start WebSocket server: %s", result["message"])
 
 # FastMCP doesn't have an on_startup decorator, so we'll handle startup differently
 # The initialize_server function will be called manually or through background tasks
@@ -914,9 +1108,10 @@ async def standalone_server():
         # Run FastMCP stdio server in the background
         fastmcp_task = asyncio.create_task(mcp.run_stdio_async(show_banner=False))
 
-        # Keep WebSocket server running
-        while ws_server and ws_server.is_serving():
-            await asyncio.sleep(1)
+        # Keep WebSocket server running; wait_closed() returns once it is
+        # stopped, without waking the event loop in between
+        if ws_server:
+            await ws_server.wait_closed()
 
     except KeyboardInterrupt:
         logger.info("Server shutdown requested")
@@ -925,15 +1120,24 @@ async def standalone_server():
         if ws_server:
             await _stop_websocket_server_logic()
     except Exception as e:
-        logger.error(f"Standalone server error: {e}")
+        logger.error("Standalone server error: %s", e)
         if not fastmcp_task.done():
             fastmcp_task.cancel()
 
 if __name__ == "__main__":
+    log_listener = _start_log_listener()
     logger.info("Unreal Blueprint MCP Server module loaded")
     logger.info("WebSocket server management enabled")
     logger.info("Use 'fastmcp dev unreal_blueprint_mcp_server.py' to start the MCP server")
-    logger.info(f"WebSocket server will be available at ws://{WS_HOST}:{WS_PORT}")
+    logger.info("WebSocket server will be available at %s", WS_URL)
+
+    # Run the standalone server on uvloop's libuv-based event loop when
+    # installed; importing the module leaves the event loop policy alone
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
     # Start standalone server (both FastMCP stdio and WebSocket)
-    asyncio.run(standalone_server())
\ No newline at end of file
+    try:
+        asyncio.run(standalone_server())
+    finally:
+        log_listener.stop()
\ No newline at end of file